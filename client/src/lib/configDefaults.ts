@@ -82,7 +82,7 @@ export const DEFAULT_CONFIG_VALUES: ConfigValues = {
   ttsModel: "mlx-community/Kokoro-82M-bf16",
   ttsLanguage: "en-US",
   ttsVoice: "af_heart",
-  ttsSentenceStreaming: false,
+  ttsSentenceStreaming: true,
   turnTaking: {
     vad: {
       confidence: 0.7,
@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from typing import List
+import re
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from pipecat.frames.frames import (
     CancelFrame,
@@ -19,6 +20,48 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.utils.string import match_endofsentence
 
+# Characters re-scanned before the cursor so multi-char terminators (e.g. "?!")
+# that straddle two fragments are still detected.
+MAX_SENTENCE_END_LOOKBACK = 4
+
+# Consumed prefix size (chars) after which the joined buffer is compacted.
+BUFFER_COMPACT_THRESHOLD = 4096
+
+# Sentence end: terminal punctuation (plus closing quotes/brackets) followed by
+# whitespace. Full-width terminators don't need trailing whitespace. A period
+# is skipped after:
+#   - dotted abbreviations ("U.S.A.", "e.g.", "a.m."),
+#   - common English and pt-BR titles ("Dr.", "Mrs.", "Sr.", "Sra.", "Profa."),
+#   - a run of initials ("J. R. R. Tolkien").
+# A lone capital with a period ("Plan B.") is an initial only if another
+# initial follows, so it waits until the next word has started to arrive.
+SENTENCE_END_PATTERN = re.compile(
+    r"(?:[?!]"
+    r"|(?<![A-Z]\.[A-Z])(?<![a-z]\.[a-z])(?<!\b[A-Z]\.\s[A-Z])"
+    r"(?<!\b(?i:mr|ms|dr|st|sr|av|vs))(?<!\b(?i:mrs|sra|dra|sta))"
+    r"(?<!\b(?i:prof|srta))(?<!\b(?i:profa))"
+    r"\.(?:(?<!\b[A-Z]\.)|(?=[.?!\"')\]]*\s+(?:[^A-Z\s]|[A-Z][^.]))))"
+    r"[.?!]*[\"')\]]*(?=\s)"
+    r"|[。？！]+"
+)
+
+# A fragment can only complete a sentence end if it contains terminal
+# punctuation or follows text ending in punctuation / a closing quote.
+TERMINATOR_CHAR_PATTERN = re.compile(r"[.?!。？！]")
+SENTENCE_TAIL_CHARS = frozenset(".?!\"')]。？！")
+
+
+FrameHandler = Callable[[Frame, FrameDirection], Awaitable[None]]
+
+# Frame type -> handler method name, checked in order (first match wins) the
+# first time a frame type is seen; the result is cached per concrete type.
+FRAME_HANDLERS = (
+    ((StartInterruptionFrame, CancelFrame), "_on_interruption"),
+    (LLMFullResponseStartFrame, "_on_response_start"),
+    ((LLMFullResponseEndFrame, EndFrame), "_on_response_end"),
+    ((TextFrame, LLMTextFrame), "_on_text"),
+)
+
 
 class AssistantSentenceAggregator(FrameProcessor):
     """Aggregate LLM text into TTS chunks with custom sentence rules.
@@ -28,42 +71,98 @@ class AssistantSentenceAggregator(FrameProcessor):
     - If a sentence has fewer than `min_words`, buffer and annex it to the
       following sentence.
     - If the response ends and a short buffer remains, emit it as-is.
+    - Each sentence is pushed as soon as it is complete; with `coalesce=True`,
+      sentences that become ready together are pushed as a single frame.
+    - Sentence ends are found with the precompiled `SENTENCE_END_PATTERN`; pass
+      `use_pipecat_matcher=True` to use pipecat's `match_endofsentence` instead.
     """
 
-    def __init__(self, *, enabled: bool, min_words: int = 3):
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        min_words: int = 3,
+        coalesce: bool = False,
+        use_pipecat_matcher: bool = False,
+    ):
         super().__init__()
         self._enabled = enabled
+        self._coalesce = coalesce
+        self._use_pipecat_matcher = use_pipecat_matcher
         self._min_words = max(1, int(min_words))
-        self._buffer = ""
+        # Fragments not yet folded into `_joined`; `_consumed` marks how much of
+        # `_joined` has already been popped, so pops don't re-slice the tail.
+        self._buffer: List[str] = []
+        self._joined = ""
+        self._consumed = 0
+        self._scanned_upto = 0
+        self._tail_char = ""
+        self._maybe_sentence_end = False
         self._carry = ""
         self._started = False
+        self._handlers: Dict[type, Optional[FrameHandler]] = {}
 
-    def _reset(self) -> None:
-        self._buffer = ""
+    def _clear_buffer(self) -> None:
+        self._buffer = []
+        self._joined = ""
+        self._consumed = 0
+        self._scanned_upto = 0
+        self._tail_char = ""
+        self._maybe_sentence_end = False
         self._carry = ""
+
+    def _reset(self) -> None:
+        self._clear_buffer()
         self._started = False
 
     def _is_short(self, text: str) -> bool:
-        return len(text.split()) < self._min_words
+        # Count whitespace-separated words, stopping once min_words is reached.
+        words = 0
+        in_word = False
+        for ch in text:
+            if ch.isspace():
+                in_word = False
+            elif not in_word:
+                in_word = True
+                words += 1
+                if words >= self._min_words:
+                    return False
+        return True
 
     def _append_text(self, text: str) -> None:
         if text:
-            self._buffer += text
+            if self._tail_char in SENTENCE_TAIL_CHARS or TERMINATOR_CHAR_PATTERN.search(text):
+                self._maybe_sentence_end = True
+            self._tail_char = text[-1]
+            self._buffer.append(text)
 
-    def _pop_sentence(self) -> str | None:
-        end = match_endofsentence(self._buffer)
-        if not end:
-            return None
-        sentence = self._buffer[:end]
-        self._buffer = self._buffer[end:]
-        return sentence.strip()
+    def _absorb_pending(self) -> None:
+        if not self._buffer:
+            return
+        pending = "".join(self._buffer)
+        self._buffer = []
+        if self._consumed > BUFFER_COMPACT_THRESHOLD:
+            self._joined = self._joined[self._consumed :] + pending
+            self._scanned_upto = max(0, self._scanned_upto - self._consumed)
+            self._consumed = 0
+        else:
+            self._joined += pending
+
+    def _find_sentence_end(self, start: int) -> int:
+        """Return the absolute end index of the first sentence at/after `start`, or 0."""
+        if self._use_pipecat_matcher:
+            end = match_endofsentence(self._joined[start:])
+            return end + start if end else 0
+        match = SENTENCE_END_PATTERN.search(self._joined, start)
+        return match.end() if match else 0
 
     def _merge_or_buffer(self, sentence: str) -> str | None:
         if not sentence:
             return None
 
         if self._carry:
-            sentence = f"{self._carry} {sentence}".strip()
+            # Both parts are already stripped.
+            sentence = self._carry + " " + sentence
             self._carry = ""
 
         if self._is_short(sentence):
@@ -73,66 +172,105 @@ class AssistantSentenceAggregator(FrameProcessor):
         return sentence
 
     async def _emit_ready_sentences(self) -> None:
+        if not self._maybe_sentence_end:
+            # Mid-sentence token: nothing new can match, skip the scan.
+            return
+        self._maybe_sentence_end = False
+        self._absorb_pending()
+        # Hot loop: pop every complete sentence using local bindings.
+        joined = self._joined
+        find_end = self._find_sentence_end
+        merge = self._merge_or_buffer
         ready: List[str] = []
+        consumed = self._consumed
+        # Only scan text appended since the last miss (plus a small lookback).
+        start = max(consumed, self._scanned_upto - MAX_SENTENCE_END_LOOKBACK)
         while True:
-            sentence = self._pop_sentence()
-            if sentence is None:
+            end = find_end(start)
+            if not end:
                 break
-            merged = self._merge_or_buffer(sentence)
-            if merged:
+            merged = merge(joined[consumed:end].strip())
+            consumed = start = end
+            if not merged:
+                continue
+            if self._coalesce:
                 ready.append(merged)
+                continue
+            # Push right away so TTS can start on the first sentence while the
+            # rest are still being scanned.
+            self._consumed = consumed
+            await self.push_frame(LLMTextFrame(merged))
+            if self._joined is not joined:
+                # Reset while pushing; the remaining text no longer applies.
+                return
+        self._consumed = consumed
+        self._scanned_upto = len(joined)
 
-        for sentence in ready:
-            await self.push_frame(LLMTextFrame(sentence))
+        if ready:
+            # One push per flush; downstream TTS re-splits on sentence ends.
+            await self.push_frame(LLMTextFrame(" ".join(ready)))
 
     async def _flush_remaining(self) -> None:
-        remaining = f"{self._carry} {self._buffer}".strip() if self._carry else self._buffer.strip()
-        self._buffer = ""
-        self._carry = ""
+        self._absorb_pending()
+        buffer = self._joined[self._consumed :]
+        remaining = f"{self._carry} {buffer}".strip() if self._carry else buffer.strip()
+        self._clear_buffer()
         if remaining:
             await self.push_frame(LLMTextFrame(remaining))
 
-    async def process_frame(self, frame: Frame, direction: FrameDirection):
-        await super().process_frame(frame, direction)
+    async def _on_interruption(self, frame: Frame, direction: FrameDirection) -> None:
+        self._reset()
+        await self.push_frame(frame, direction)
 
-        if isinstance(frame, StartInterruptionFrame):
-            self._reset()
-            await self.push_frame(frame, direction)
-            return
+    async def _on_response_start(self, frame: Frame, direction: FrameDirection) -> None:
+        self._clear_buffer()
+        self._started = True
+        await self.push_frame(frame, direction)
 
-        if isinstance(frame, CancelFrame):
-            self._reset()
-            await self.push_frame(frame, direction)
-            return
+    async def _on_response_end(self, frame: Frame, direction: FrameDirection) -> None:
+        if self._enabled:
+            await self._emit_ready_sentences()
+            await self._flush_remaining()
+        else:
+            await self._flush_remaining()
+        self._started = False
+        await self.push_frame(frame, direction)
 
-        if isinstance(frame, LLMFullResponseStartFrame):
-            self._buffer = ""
-            self._carry = ""
+    async def _on_text(self, frame: Frame, direction: FrameDirection) -> None:
+        if not self._started:
+            # Treat streamed LLM text as part of the current response even if
+            # we missed the start frame to avoid duplicating output.
             self._started = True
-            await self.push_frame(frame, direction)
-            return
 
-        if isinstance(frame, (LLMFullResponseEndFrame, EndFrame)):
-            if self._enabled:
-                await self._emit_ready_sentences()
-                await self._flush_remaining()
-            else:
-                await self._flush_remaining()
-            self._started = False
-            await self.push_frame(frame, direction)
+        if not self._enabled:
+            # When disabled, we intentionally do not emit text until response
+            # end, so just collect fragments; they are joined once on flush.
+            if frame.text:
+                self._buffer.append(frame.text)
             return
 
-        if isinstance(frame, (TextFrame, LLMTextFrame)):
-            if not self._started:
-                # Treat streamed LLM text as part of the current response even if
-                # we missed the start frame to avoid duplicating output.
-                self._started = True
+        self._append_text(frame.text)
+        await self._emit_ready_sentences()
 
-            self._append_text(frame.text)
+    def _resolve_handler(self, frame_type: type) -> Optional[FrameHandler]:
+        handler = None
+        for frame_types, name in FRAME_HANDLERS:
+            if issubclass(frame_type, frame_types):
+                handler = getattr(self, name)
+                break
+        self._handlers[frame_type] = handler
+        return handler
 
-            if self._enabled:
-                await self._emit_ready_sentences()
-            # When disabled, we intentionally do not emit text until response end.
-            return
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
 
-        await self.push_frame(frame, direction)
+        frame_type = type(frame)
+        try:
+            handler = self._handlers[frame_type]
+        except KeyError:
+            handler = self._resolve_handler(frame_type)
+
+        if handler is None:
+            await self.push_frame(frame, direction)
+            return
+        await handler(frame, direction)
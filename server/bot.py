@@ -1,48 +1,30 @@
 import argparse
 import asyncio
-import json
+import copy
+import functools
 import math
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
-from typing import Dict, Optional
-
-# Add local pipecat to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "pipecat", "src"))
-import sitecustomize  # noqa: F401
-
-# Transformers compatibility shim for smart-turn v2 on older versions.
-try:
-    from transformers.modeling_utils import PreTrainedModel
-
-    def _get_all_tied(self):
-        keys = getattr(self, "_all_tied_weights_keys", None)
-        if keys is not None:
-            return keys
-        keys = getattr(self, "_tied_weights_keys", None)
-        if keys is None:
-            return {}
-        if isinstance(keys, dict):
-            return keys
-        if isinstance(keys, (list, tuple, set)):
-            return {k: None for k in keys}
-        return {}
-
-    def _set_all_tied(self, value):
-        object.__setattr__(self, "_all_tied_weights_keys", value)
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Tuple
 
-    PreTrainedModel.all_tied_weights_keys = property(_get_all_tied, _set_all_tied)
-except Exception:
-    pass
+# Prefer a local pipecat checkout when one exists; otherwise keep sys.path
+# untouched so imports resolve straight from the installed pipecat-ai.
+_LOCAL_PIPECAT_SRC = os.path.join(os.path.dirname(__file__), "pipecat", "src")
+if os.path.isdir(_LOCAL_PIPECAT_SRC):
+    sys.path.insert(0, _LOCAL_PIPECAT_SRC)
 
+import orjson
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from pipecat.audio.turn.smart_turn.base_smart_turn import SmartTurnParams
-from pipecat.audio.turn.smart_turn.local_smart_turn_v2 import LocalSmartTurnAnalyzerV2
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
@@ -51,7 +33,6 @@ from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
 from pipecat.services.openai.base_llm import BaseOpenAILLMService
 from pipecat.services.openai.llm import OpenAILLMService
 
-from pipecat.services.whisper.stt import WhisperSTTServiceMLX, MLXModel
 from pipecat.transcriptions.language import Language
 from pipecat.transports.base_transport import TransportParams
 from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
@@ -60,14 +41,113 @@ from pipecat.transports.network.webrtc_connection import IceServer, SmallWebRTCC
 from pipecat.processors.aggregators.llm_response import LLMUserAggregatorParams
 from pipecat.frames.frames import LLMTextFrame
 
-from tts_mlx_isolated import TTSMLXIsolated
 from assistant_sentence_aggregator import AssistantSentenceAggregator
 
-load_dotenv(override=True)
+# Model-backed services (Whisper MLX, Silero, smart-turn, TTS workers) are
+# imported where they are constructed so the HTTP server starts without
+# loading MLX / torch.
+if TYPE_CHECKING:
+    from pipecat.services.whisper.stt import WhisperSTTServiceMLX
+
+
+@functools.cache
+def _install_transformers_shim() -> None:
+    """Transformers compatibility shim for smart-turn v2 on older versions.
+
+    Applied right before smart-turn is loaded, since importing
+    transformers pulls in torch. sitecustomize's patches (phonemizer,
+    transformers>=5) are deferred along with it.
+    """
+    import sitecustomize  # noqa: F401
+
+    try:
+        from transformers.modeling_utils import PreTrainedModel
+
+        def _get_all_tied(self):
+            keys = getattr(self, "_all_tied_weights_keys", None)
+            if keys is not None:
+                return keys
+            keys = getattr(self, "_tied_weights_keys", None)
+            if keys is None:
+                return {}
+            if isinstance(keys, dict):
+                return keys
+            if isinstance(keys, (list, tuple, set)):
+                return {k: None for k in keys}
+            return {}
+
+        def _set_all_tied(self, value):
+            object.__setattr__(self, "_all_tied_weights_keys", value)
 
-app = FastAPI()
+        PreTrainedModel.all_tied_weights_keys = property(_get_all_tied, _set_all_tied)
+    except Exception:
+        pass
+
+
+@functools.cache
+def _init_env() -> None:
+    """Load .env and set up logging once; run from __main__ and the lifespan,
+    not at import."""
+    load_dotenv(override=True)
+    _configure_logging()
+
+
+def _configure_logging() -> None:
+    # IARA_LOG_LEVEL (default INFO) applies to the whole process, pipecat
+    # included; set it to DEBUG for offer timings and raw LLM chunk dumps.
+    level = os.environ.get("IARA_LOG_LEVEL", "").strip().upper() or "INFO"
+    try:
+        logger.level(level)
+    except ValueError:
+        logger.warning(f"Unknown IARA_LOG_LEVEL {level!r}; using INFO")
+        level = "INFO"
+    # Write logs from a background thread so bursts of participant churn or
+    # per-frame debug logging never block the event loop on stderr.
+    logger.remove()
+    logger.add(sys.stderr, level=level, enqueue=True, backtrace=False, diagnose=False)
+
+
+async def _disconnect_peer(pc: SmallWebRTCConnection) -> None:
+    try:
+        await asyncio.wait_for(pc.disconnect(), timeout=PEER_DISCONNECT_TIMEOUT_SECS)
+    except Exception as exc:
+        logger.warning(f"Peer {pc.pc_id} did not disconnect cleanly: {exc!r}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _init_env()
+    # Parse + validate the config and start loading its models in the
+    # background, so the first connection finds warm weights.
+    await warmup_models()
+    yield  # Run app
+    # Snapshot and clear in one step so closed handlers and late offers don't
+    # race the shutdown gather.
+    connections = list(pcs_map.values())
+    pcs_map.clear()
+    bots = list(bot_tasks.values())
+    if WARMUP_TASK is not None:
+        bots.append(WARMUP_TASK)
+    for bot in bots:
+        bot.cancel()
+    await asyncio.gather(
+        *(_disconnect_peer(pc) for pc in connections), *bots, return_exceptions=True
+    )
+    # Bots and warmup are gone, so no one holds a TTS worker; stop them, spares
+    # included, rather than leaving them to the interpreter exit.
+    tts_module = sys.modules.get("tts_mlx_isolated")
+    if tts_module is not None:
+        await tts_module.TTSMLXIsolated.stop_all_workers()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+# SDP answers are a few KB of very compressible text.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 pcs_map: Dict[str, SmallWebRTCConnection] = {}
+# One run_bot task per peer, keyed like pcs_map; entries drop out when the task ends.
+bot_tasks: Dict[str, asyncio.Task] = {}
+pcs_lock = asyncio.Lock()
 
 ice_servers = [
     IceServer(
@@ -75,10 +155,22 @@ ice_servers = [
     )
 ]
 
+PEER_DISCONNECT_TIMEOUT_SECS = 2.0
+
 WARMUP_STATE = {"status": "idle", "error": None}
 WARMUP_SIGNATURE = None
 WARMUP_TASK: Optional[asyncio.Task] = None
 
+# (config file mtime_ns, validated config) from the last _load_active_config call.
+_CONFIG_CACHE: Optional[Tuple[Optional[tuple], dict]] = None
+
+# Idle VAD / smart-turn analyzers keyed by their params. Both load model weights
+# in their constructors, so a new connection borrows an idle one when it can.
+# They hold per-stream state, so an analyzer is only ever used by one connection.
+_ANALYZER_POOL: Dict[tuple, List[object]] = {}
+# (STT, TTS) services from the last successful warmup, keyed by its signature.
+_WARMED_SERVICES: Dict[tuple, Tuple[object, object]] = {}
+
 
 DEFAULT_SYSTEM_PROMPT = (
     "You are Pipecat, a friendly, helpful chatbot.\n\n"
@@ -95,101 +187,65 @@ DEFAULT_SYSTEM_PROMPT = (
     "for the user."
 )
 
+# The context appends new messages rather than editing existing ones, so the
+# default prompt's message can be shared; each peer still gets its own list.
+_DEFAULT_SYSTEM_MESSAGES = ({"role": "user", "content": DEFAULT_SYSTEM_PROMPT},)
 
-CONFIG_PATH = os.environ.get(
-    "VOICE_UI_CONFIG_PATH",
-    os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "client", ".config", "voice-ui-config.json")
-    ),
-)
 
-SUPPORTED_WHISPER_MODELS = {
-    MLXModel.TINY.value,
-    MLXModel.MEDIUM.value,
-    MLXModel.LARGE_V3.value,
-    MLXModel.LARGE_V3_TURBO.value,
-    MLXModel.DISTIL_LARGE_V3.value,
-    MLXModel.LARGE_V3_TURBO_Q4.value,
-}
+@functools.cache
+def _config_path() -> str:
+    return os.environ.get(
+        "VOICE_UI_CONFIG_PATH",
+        os.path.abspath(
+            os.path.join(os.path.dirname(__file__), "..", "client", ".config", "voice-ui-config.json")
+        ),
+    )
 
-SUPPORTED_WHISPER_LANGUAGES = {
-    "ar",
-    "bn",
-    "cs",
-    "da",
-    "de",
-    "el",
-    "en",
-    "es",
-    "fa",
-    "fi",
-    "fr",
-    "hi",
-    "hu",
-    "id",
-    "it",
-    "ja",
-    "ko",
-    "nl",
-    "pl",
-    "pt",
-    "ro",
-    "ru",
-    "sk",
-    "sv",
-    "th",
-    "tr",
-    "uk",
-    "ur",
-    "vi",
-    "zh",
-}
+
+def _interned(values) -> frozenset:
+    # Model ids etc. aren't identifier-like, so the compiler doesn't intern
+    # them; interning both these tables and validated config values lets
+    # equality checks short-circuit on identity.
+    return frozenset(sys.intern(value) for value in values)
+
+
+# MLXModel values from pipecat.services.whisper.stt, inlined to avoid importing
+# the MLX STT service at module load.
+SUPPORTED_WHISPER_MODELS = _interned(
+    {
+        "mlx-community/whisper-tiny",
+        "mlx-community/whisper-medium-mlx",
+        "mlx-community/whisper-large-v3-mlx",
+        "mlx-community/whisper-large-v3-turbo",
+        "mlx-community/distil-whisper-large-v3",
+        "mlx-community/whisper-large-v3-turbo-q4",
+    }
+)
 
 LANGUAGE_MAP = {
-    "ar": Language.AR,
-    "bn": Language.BN,
-    "cs": Language.CS,
-    "da": Language.DA,
-    "de": Language.DE,
-    "el": Language.EL,
-    "en": Language.EN,
-    "es": Language.ES,
-    "fa": Language.FA,
-    "fi": Language.FI,
-    "fr": Language.FR,
-    "hi": Language.HI,
-    "hu": Language.HU,
-    "id": Language.ID,
-    "it": Language.IT,
-    "ja": Language.JA,
-    "ko": Language.KO,
-    "nl": Language.NL,
-    "pl": Language.PL,
-    "pt": Language.PT,
-    "ro": Language.RO,
-    "ru": Language.RU,
-    "sk": Language.SK,
-    "sv": Language.SV,
-    "th": Language.TH,
-    "tr": Language.TR,
-    "uk": Language.UK,
-    "ur": Language.UR,
-    "vi": Language.VI,
-    "zh": Language.ZH,
+    code: getattr(Language, code.upper())
+    for code in (
+        "ar", "bn", "cs", "da", "de", "el", "en", "es", "fa", "fi", "fr", "hi", "hu", "id", "it", "ja",
+        "ko", "nl", "pl", "pt", "ro", "ru", "sk", "sv", "th", "tr", "uk", "ur", "vi", "zh",
+    )
 }
 
-SUPPORTED_TTS_MODELS = {
-    "mlx-community/Kokoro-82M-bf16",
-    "Marvis-AI/marvis-tts-250m-v0.1",
-    "mlx-community/Qwen3-TTS",
-    "mlx-community/Qwen3-TTS-12Hz-0.6B-Base-bf16",
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",
-    "mlx-community/Qwen3-TTS-12Hz-0.6B-CustomVoice-bf16",
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-CustomVoice-bf16",
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-VoiceDesign-bf16",
-}
+SUPPORTED_WHISPER_LANGUAGES = frozenset(LANGUAGE_MAP)
+
+SUPPORTED_TTS_MODELS = _interned(
+    {
+        "mlx-community/Kokoro-82M-bf16",
+        "Marvis-AI/marvis-tts-250m-v0.1",
+        "mlx-community/Qwen3-TTS",
+        "mlx-community/Qwen3-TTS-12Hz-0.6B-Base-bf16",
+        "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",
+        "mlx-community/Qwen3-TTS-12Hz-0.6B-CustomVoice-bf16",
+        "mlx-community/Qwen3-TTS-12Hz-1.7B-CustomVoice-bf16",
+        "mlx-community/Qwen3-TTS-12Hz-1.7B-VoiceDesign-bf16",
+    }
+)
 
-KOKORO_VOICE_LIST = [
+KOKORO_VOICE_LIST = (
     ("af_heart", "en-US"),
     ("af_alloy", "en-US"),
     ("af_aoede", "en-US"),
@@ -244,19 +300,22 @@ KOKORO_VOICE_LIST = [
     ("pf_dora", "pt-BR"),
     ("pm_alex", "pt-BR"),
     ("pm_santa", "pt-BR"),
-]
+)
 
-KOKORO_VOICES = {voice_id for voice_id, _ in KOKORO_VOICE_LIST}
-KOKORO_VOICE_LANGUAGE = {
-    voice_id: language for voice_id, language in KOKORO_VOICE_LIST
-}
-KOKORO_VOICES_BY_LANGUAGE = {}
+_kokoro_voices_by_language: Dict[str, List[str]] = {}
 for voice_id, language in KOKORO_VOICE_LIST:
-    KOKORO_VOICES_BY_LANGUAGE.setdefault(language, []).append(voice_id)
+    _kokoro_voices_by_language.setdefault(language, []).append(voice_id)
+# Read-only views: these tables are shared by every config parse.
+KOKORO_VOICE_LANGUAGE: Mapping[str, str] = MappingProxyType(dict(KOKORO_VOICE_LIST))
+KOKORO_VOICES = frozenset(KOKORO_VOICE_LANGUAGE)
+KOKORO_VOICES_BY_LANGUAGE: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {language: tuple(voices) for language, voices in _kokoro_voices_by_language.items()}
+)
+del _kokoro_voices_by_language
 
-MARVIS_VOICES = {"conversational_a"}
+MARVIS_VOICES = frozenset({"conversational_a"})
 
-SUPPORTED_TTS_LANGUAGES = set(KOKORO_VOICES_BY_LANGUAGE.keys())
+SUPPORTED_TTS_LANGUAGES = _interned(KOKORO_VOICES_BY_LANGUAGE)
 TTS_LANGUAGE_ALIASES = {
     "pt": "pt-BR",
     "pt-br": "pt-BR",
@@ -265,13 +324,19 @@ TTS_LANGUAGE_ALIASES = {
     "ptbr": "pt-BR",
 }
 
+# Canonical codes map to themselves so already-valid input skips strip/lower.
+_TTS_LANGUAGE_LOOKUP = {
+    **{language: language for language in SUPPORTED_TTS_LANGUAGES},
+    **TTS_LANGUAGE_ALIASES,
+}
+
 DEFAULT_CONFIG = {
-    "whisperModel": MLXModel.LARGE_V3_TURBO_Q4.value,
+    "whisperModel": "mlx-community/whisper-large-v3-turbo-q4",
     "whisperLanguage": "en",
     "ttsModel": "mlx-community/Kokoro-82M-bf16",
     "ttsLanguage": "en-US",
     "ttsVoice": "af_heart",
-    "ttsSentenceStreaming": False,
+    "ttsSentenceStreaming": True,
     "turnTaking": {
         "vad": {
             "confidence": 0.7,
@@ -324,31 +389,48 @@ DEFAULT_CONFIG = {
     "systemPrompt": DEFAULT_SYSTEM_PROMPT,
 }
 
-QWEN_TTS_MODELS = {
-    "mlx-community/Qwen3-TTS-12Hz-0.6B-Base-bf16",
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",
-    "mlx-community/Qwen3-TTS-12Hz-0.6B-CustomVoice-bf16",
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-CustomVoice-bf16",
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-VoiceDesign-bf16",
-}
+QWEN_TTS_MODELS = _interned(
+    {
+        "mlx-community/Qwen3-TTS-12Hz-0.6B-Base-bf16",
+        "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",
+        "mlx-community/Qwen3-TTS-12Hz-0.6B-CustomVoice-bf16",
+        "mlx-community/Qwen3-TTS-12Hz-1.7B-CustomVoice-bf16",
+        "mlx-community/Qwen3-TTS-12Hz-1.7B-VoiceDesign-bf16",
+    }
+)
 
 QWEN_TTS_SENTINEL = "mlx-community/Qwen3-TTS"
 
-QWEN_TTS_LANGUAGES = {
-    "auto",
-    "english",
-    "chinese",
-    "japanese",
-    "korean",
-    "portuguese",
-    "french",
-    "german",
-    "italian",
-    "spanish",
-    "russian",
-}
-QWEN_TTS_SPEAKERS = {"Ryan", "Aiden", "Vivian", "Serena", "Uncle_Fu", "Dylan", "Eric"}
-QWEN_TTS_MODES = {"base", "customVoice", "voiceDesign", "voiceCloning"}
+# TTS backend families, from the model id prefix.
+TTS_KIND_KOKORO = 0
+TTS_KIND_MARVIS = 1
+TTS_KIND_QWEN = 2
+
+
+def _tts_kind(model: str) -> int:
+    if model.startswith(QWEN_TTS_SENTINEL):
+        return TTS_KIND_QWEN
+    if model.startswith("Marvis-AI"):
+        return TTS_KIND_MARVIS
+    return TTS_KIND_KOKORO
+
+QWEN_TTS_LANGUAGES = frozenset(
+    {
+        "auto",
+        "english",
+        "chinese",
+        "japanese",
+        "korean",
+        "portuguese",
+        "french",
+        "german",
+        "italian",
+        "spanish",
+        "russian",
+    }
+)
+QWEN_TTS_SPEAKERS = frozenset({"Ryan", "Aiden", "Vivian", "Serena", "Uncle_Fu", "Dylan", "Eric"})
+QWEN_TTS_MODES = frozenset({"base", "customVoice", "voiceDesign", "voiceCloning"})
 
 QWEN_LANGUAGE_ALIASES = {
     "en": "english",
@@ -378,6 +460,211 @@ QWEN_LANGUAGE_ALIASES = {
     "auto": "auto",
 }
 
+LLM_PROVIDERS = _interned({"openai-compatible", "ollama"})
+
+
+def _is_one_of(allowed: frozenset) -> Callable[[object], bool]:
+    def check(value: object) -> bool:
+        try:
+            return value in allowed
+        except TypeError:  # unhashable JSON value (list/dict)
+            return False
+
+    return check
+
+
+def _is_non_empty_str(value: object) -> bool:
+    return isinstance(value, str) and bool(value)
+
+
+def _is_non_blank_str(value: object) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def _is_bool(value: object) -> bool:
+    return isinstance(value, bool)
+
+
+# Top-level config key -> check; invalid values fall back to DEFAULT_CONFIG.
+# Nested / cross-field settings (qwenTts, ttsVoice, turnTaking, ...) are
+# normalized separately in _parse_active_config.
+_CONFIG_VALIDATORS: Dict[str, Callable[[object], bool]] = {
+    "whisperModel": _is_one_of(SUPPORTED_WHISPER_MODELS),
+    "whisperLanguage": _is_one_of(SUPPORTED_WHISPER_LANGUAGES),
+    "ttsModel": _is_one_of(SUPPORTED_TTS_MODELS),
+    "ttsSentenceStreaming": _is_bool,
+    "llmProvider": _is_one_of(LLM_PROVIDERS),
+    "llmBaseUrl": _is_non_empty_str,
+    "llmModel": _is_non_empty_str,
+    "systemPrompt": _is_non_blank_str,
+}
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
+
+def _parse_bool(value: object, fallback: bool) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in _TRUE_STRINGS:
+            return True
+        if normalized in _FALSE_STRINGS:
+            return False
+    return fallback
+
+
+def _parse_flag(value: object, fallback: bool) -> bool:
+    """Like _parse_bool, but numbers are not accepted as flags."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return fallback
+    return _parse_bool(value, fallback)
+
+
+def _parse_number(value: object, fallback: float) -> float:
+    if isinstance(value, bool):
+        return fallback
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return fallback
+    return fallback
+
+
+def _parse_optional_number(value: object):
+    if value is None or value == "":
+        return None
+    parsed = _parse_number(value, None)
+    if parsed is None or (isinstance(parsed, float) and math.isnan(parsed)):
+        return None
+    return parsed
+
+
+def _parse_optional_int(value: object):
+    parsed = _parse_optional_number(value)
+    if parsed is None:
+        return None
+    try:
+        return int(parsed)
+    except (TypeError, ValueError):
+        return None
+
+
+def _coerce_int(value: object, fallback: int) -> int:
+    if isinstance(value, bool):
+        return int(value)
+    return value if isinstance(value, int) else fallback
+
+
+def _coerce_float(value: object, fallback: float) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float(fallback)
+
+
+def _coerce_str(value: object, fallback: str) -> str:
+    return value if isinstance(value, str) else fallback
+
+
+def _non_negative(value: float) -> float:
+    return value if value >= 0 else type(value)(0)
+
+
+def _unit_interval(value: float) -> float:
+    return max(0.0, min(1.0, value))
+
+
+# (key, coerce(value, default), clamp or None). Defaults come from
+# DEFAULT_CONFIG; enum-like keys (mode, model, language, speaker) are
+# checked separately because they depend on each other.
+QWEN_TTS_SCHEMA = (
+    ("instruct", _coerce_str, None),
+    ("refAudioPath", _coerce_str, None),
+    ("refText", _coerce_str, None),
+    ("seed", _coerce_int, None),
+    ("temperature", _coerce_float, None),
+    ("topK", _coerce_int, _non_negative),
+    ("topP", _coerce_float, None),
+    ("repetitionPenalty", _coerce_float, None),
+    ("maxTokens", _coerce_int, _non_negative),
+    ("doSample", _parse_flag, None),
+    ("speed", _coerce_float, None),
+    ("sttModel", _coerce_str, None),
+    ("xVectorOnlyMode", _parse_flag, None),
+)
+
+TURN_TAKING_SCHEMA = {
+    "vad": (
+        ("confidence", _parse_number, _unit_interval),
+        ("startSecs", _parse_number, _non_negative),
+        ("stopSecs", _parse_number, _non_negative),
+        ("minVolume", _parse_number, _unit_interval),
+    ),
+    "smartTurn": (
+        ("enabled", _parse_bool, None),
+        ("stopSecs", _parse_number, _non_negative),
+        ("preSpeechMs", _parse_number, _non_negative),
+        ("maxDurationSecs", _parse_number, _non_negative),
+    ),
+}
+
+# (normalized key, accepted input keys, parser) for llmOllamaOptions.
+OLLAMA_OPTIONS_SCHEMA = (
+    ("temperature", ("temperature",), _parse_optional_number),
+    ("top_k", ("topK", "top_k"), _parse_optional_int),
+    ("top_p", ("topP", "top_p"), _parse_optional_number),
+    ("min_p", ("minP", "min_p"), _parse_optional_number),
+    ("repeat_penalty", ("repeatPenalty", "repeat_penalty"), _parse_optional_number),
+    ("repeat_last_n", ("repeatLastN", "repeat_last_n"), _parse_optional_int),
+    ("seed", ("seed",), _parse_optional_int),
+    ("num_predict", ("numPredict", "num_predict"), _parse_optional_int),
+    ("num_ctx", ("numCtx", "num_ctx"), _parse_optional_int),
+)
+
+
+_INTERNED_CONFIG_KEYS = (
+    "whisperModel", "whisperLanguage", "ttsModel", "ttsLanguage", "ttsVoice", "llmProvider",
+)
+_INTERNED_QWEN_TTS_KEYS = ("mode", "model", "language", "speaker")
+
+
+def _intern_strings(values: dict, keys: tuple) -> None:
+    for key in keys:
+        value = values.get(key)
+        if isinstance(value, str):
+            values[key] = sys.intern(value)
+
+
+def _apply_schema(values: dict, defaults: dict, schema: tuple) -> dict:
+    result = {}
+    for key, coerce, clamp in schema:
+        value = coerce(values.get(key), defaults[key])
+        result[key] = clamp(value) if clamp else value
+    return result
+
+
+class FilteredRTVIObserver(RTVIObserver):
+    def __init__(self, *args, llm_sources=None, llm_destinations=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._llm_sources = set(llm_sources or [])
+        self._llm_destinations = set(llm_destinations or [])
+
+    async def on_push_frame(self, data):
+        if isinstance(data.frame, LLMTextFrame):
+            if self._llm_sources and data.source not in self._llm_sources:
+                self._frames_seen.add(data.frame.id)
+                return
+            if self._llm_destinations and data.destination not in self._llm_destinations:
+                self._frames_seen.add(data.frame.id)
+                return
+        await super().on_push_frame(data)
+
 
 class LoggingOpenAILLMService(OpenAILLMService):
     def __init__(self, *args, log_raw_chunks: bool = False, **kwargs):
@@ -389,25 +676,35 @@ class LoggingOpenAILLMService(OpenAILLMService):
         if not self._log_raw_chunks:
             return chunks
 
+        # lazy=True: the dump only runs if a sink actually accepts DEBUG.
+        lazy_logger = logger.opt(lazy=True)
+
         async def generator():
             async for chunk in chunks:
-                payload = None
-                try:
-                    payload = chunk.model_dump()
-                except Exception:
-                    try:
-                        payload = chunk.to_dict()
-                    except Exception:
-                        payload = str(chunk)
-                logger.debug(f"{self}: raw chunk: {payload}")
+                lazy_logger.debug(
+                    "{}: raw chunk: {}", lambda: self, lambda c=chunk: _dump_chunk(c)
+                )
                 yield chunk
 
         return generator()
 
 
+def _dump_chunk(chunk) -> object:
+    try:
+        return chunk.model_dump()
+    except Exception:
+        try:
+            return chunk.to_dict()
+        except Exception:
+            return str(chunk)
+
+
 def _normalize_tts_language(value: object) -> str:
     if not isinstance(value, str):
         return ""
+    canonical = _TTS_LANGUAGE_LOOKUP.get(value)
+    if canonical:
+        return canonical
     normalized = value.strip()
     if not normalized:
         return ""
@@ -425,26 +722,45 @@ def _default_voice_for_language(language: str) -> Optional[str]:
 def _normalize_qwen_language(value: object) -> str:
     if not isinstance(value, str):
         return ""
+    if value in QWEN_TTS_LANGUAGES:
+        return value
     normalized = value.strip().lower()
     if not normalized:
         return ""
     return QWEN_LANGUAGE_ALIASES.get(normalized, normalized)
 
 
-def _qwen_model_size(model: str) -> str:
+def _scan_qwen_model(model: str) -> Tuple[str, str]:
     if "1.7B" in model:
-        return "1.7B"
-    if "0.6B" in model:
-        return "0.6B"
-    return ""
+        size = "1.7B"
+    elif "0.6B" in model:
+        size = "0.6B"
+    else:
+        size = ""
+    if "VoiceDesign" in model:
+        mode = "voiceDesign"
+    elif "CustomVoice" in model:
+        mode = "customVoice"
+    else:
+        mode = "base"
+    return size, mode
+
+
+# model id -> (size, mode) for the known Qwen3-TTS checkpoints.
+_QWEN_MODEL_META = MappingProxyType({model: _scan_qwen_model(model) for model in QWEN_TTS_MODELS})
+
+
+def _qwen_model_meta(model: str) -> Tuple[str, str]:
+    meta = _QWEN_MODEL_META.get(model)
+    return meta if meta is not None else _scan_qwen_model(model)
+
+
+def _qwen_model_size(model: str) -> str:
+    return _qwen_model_meta(model)[0]
 
 
 def _qwen_model_mode(model: str) -> str:
-    if "VoiceDesign" in model:
-        return "voiceDesign"
-    if "CustomVoice" in model:
-        return "customVoice"
-    return "base"
+    return _qwen_model_meta(model)[1]
 
 
 def _qwen_pick_model_for_mode(mode: str, current_model: str) -> str:
@@ -465,39 +781,70 @@ def _qwen_pick_model_for_mode(mode: str, current_model: str) -> str:
     )
 
 
+def _config_stamp() -> Optional[tuple]:
+    # Size as well as mtime, so a rewrite within the filesystem's timestamp
+    # granularity still invalidates the cache.
+    try:
+        stat = os.stat(_config_path())
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def _load_active_config() -> dict:
+    """Return the validated active preset, re-parsing only when the file changes."""
+    global _CONFIG_CACHE
+    stamp = _config_stamp()
+    if _CONFIG_CACHE is None or _CONFIG_CACHE[0] != stamp:
+        config = _parse_active_config()
+        # Derived per-config values, computed once per file change rather
+        # than on every connection.
+        config["_warmupSignature"] = _warmup_signature(config)
+        config["_analyzerSpecs"] = _turn_analyzer_specs(config)
+        config["_ollamaExtraBody"] = _ollama_extra_body(config)
+        _CONFIG_CACHE = (stamp, config)
+    # Deep copy: callers get their own nested dicts (qwenTts, turnTaking, ...).
+    return copy.deepcopy(_CONFIG_CACHE[1])
+
+
+async def _load_active_config_async() -> dict:
+    """_load_active_config with the stat (and any re-parse) run off the event loop."""
+    return await asyncio.to_thread(_load_active_config)
+
+
+def _parse_active_config() -> dict:
     try:
-        with open(CONFIG_PATH, "r") as file:
-            parsed = json.load(file)
+        with open(_config_path(), "rb") as file:
+            parsed = orjson.loads(file.read())
         presets = parsed.get("presets", [])
         active_id = parsed.get("activePresetId")
-        active = None
-        for preset in presets:
-            if preset.get("id") == active_id:
-                active = preset
-                break
+        # First match wins; entries past it are never touched, so a malformed
+        # preset further down doesn't discard the whole config.
+        active = next(
+            (p for p in presets if isinstance(p, dict) and p.get("id") == active_id),
+            None,
+        )
         if not active and presets:
             active = presets[0]
         values = active.get("values", {}) if active else {}
     except Exception:
         values = {}
 
-    config = DEFAULT_CONFIG.copy()
+    # Deep copy so no nested default (e.g. qwenTts for non-Qwen models) ends
+    # up shared between DEFAULT_CONFIG and the cached config.
+    config = copy.deepcopy(DEFAULT_CONFIG)
     for key in config.keys():
         if key in values:
             config[key] = values[key]
 
-    if config["whisperModel"] not in SUPPORTED_WHISPER_MODELS:
-        config["whisperModel"] = DEFAULT_CONFIG["whisperModel"]
-
-    if config["whisperLanguage"] not in SUPPORTED_WHISPER_LANGUAGES:
-        config["whisperLanguage"] = DEFAULT_CONFIG["whisperLanguage"]
-
-    if config["ttsModel"] not in SUPPORTED_TTS_MODELS:
-        config["ttsModel"] = DEFAULT_CONFIG["ttsModel"]
+    for key, is_valid in _CONFIG_VALIDATORS.items():
+        if not is_valid(config.get(key)):
+            config[key] = DEFAULT_CONFIG[key]
+    # whisperLanguage was validated against SUPPORTED_WHISPER_LANGUAGES above.
+    config["_whisperLanguageEnum"] = LANGUAGE_MAP[config["whisperLanguage"]]
 
-    is_qwen_model = config["ttsModel"].startswith("mlx-community/Qwen3-TTS")
-    if is_qwen_model:
+    tts_kind = config["_ttsKind"] = _tts_kind(config["ttsModel"])
+    if tts_kind == TTS_KIND_QWEN:
         qwen_config = config.get("qwenTts") if isinstance(config.get("qwenTts"), dict) else {}
         config["qwenTts"] = DEFAULT_CONFIG["qwenTts"].copy()
         for key in config["qwenTts"].keys():
@@ -521,78 +868,9 @@ def _load_active_config() -> dict:
         config["qwenTts"]["language"] = normalized_qwen_language
         if config["qwenTts"]["speaker"] not in QWEN_TTS_SPEAKERS:
             config["qwenTts"]["speaker"] = DEFAULT_CONFIG["qwenTts"]["speaker"]
-        if not isinstance(config["qwenTts"].get("instruct"), str):
-            config["qwenTts"]["instruct"] = ""
-        if not isinstance(config["qwenTts"].get("refAudioPath"), str):
-            config["qwenTts"]["refAudioPath"] = ""
-        if not isinstance(config["qwenTts"].get("refText"), str):
-            config["qwenTts"]["refText"] = ""
-        seed = config["qwenTts"].get("seed")
-        if isinstance(seed, bool):
-            seed = int(seed)
-        if not isinstance(seed, int):
-            seed = DEFAULT_CONFIG["qwenTts"]["seed"]
-        config["qwenTts"]["seed"] = seed
-        temperature = config["qwenTts"].get("temperature")
-        if isinstance(temperature, bool):
-            temperature = float(temperature)
-        if not isinstance(temperature, (int, float)):
-            temperature = DEFAULT_CONFIG["qwenTts"]["temperature"]
-        config["qwenTts"]["temperature"] = float(temperature)
-        top_k = config["qwenTts"].get("topK")
-        if isinstance(top_k, bool):
-            top_k = int(top_k)
-        if not isinstance(top_k, int):
-            top_k = DEFAULT_CONFIG["qwenTts"]["topK"]
-        config["qwenTts"]["topK"] = max(0, top_k)
-        top_p = config["qwenTts"].get("topP")
-        if isinstance(top_p, bool):
-            top_p = float(top_p)
-        if not isinstance(top_p, (int, float)):
-            top_p = DEFAULT_CONFIG["qwenTts"]["topP"]
-        config["qwenTts"]["topP"] = float(top_p)
-        repetition_penalty = config["qwenTts"].get("repetitionPenalty")
-        if isinstance(repetition_penalty, bool):
-            repetition_penalty = float(repetition_penalty)
-        if not isinstance(repetition_penalty, (int, float)):
-            repetition_penalty = DEFAULT_CONFIG["qwenTts"]["repetitionPenalty"]
-        config["qwenTts"]["repetitionPenalty"] = float(repetition_penalty)
-        max_tokens = config["qwenTts"].get("maxTokens")
-        if isinstance(max_tokens, bool):
-            max_tokens = int(max_tokens)
-        if not isinstance(max_tokens, int):
-            max_tokens = DEFAULT_CONFIG["qwenTts"]["maxTokens"]
-        config["qwenTts"]["maxTokens"] = max(0, max_tokens)
-        do_sample = config["qwenTts"].get("doSample")
-        if isinstance(do_sample, str):
-            normalized = do_sample.strip().lower()
-            if normalized in {"true", "1", "yes", "on"}:
-                do_sample = True
-            elif normalized in {"false", "0", "no", "off"}:
-                do_sample = False
-        if not isinstance(do_sample, bool):
-            do_sample = DEFAULT_CONFIG["qwenTts"]["doSample"]
-        config["qwenTts"]["doSample"] = do_sample
-        speed = config["qwenTts"].get("speed")
-        if isinstance(speed, bool):
-            speed = float(speed)
-        if not isinstance(speed, (int, float)):
-            speed = DEFAULT_CONFIG["qwenTts"]["speed"]
-        config["qwenTts"]["speed"] = float(speed)
-        stt_model = config["qwenTts"].get("sttModel")
-        if not isinstance(stt_model, str):
-            stt_model = DEFAULT_CONFIG["qwenTts"]["sttModel"]
-        config["qwenTts"]["sttModel"] = stt_model
-        x_vector_only_mode = config["qwenTts"].get("xVectorOnlyMode")
-        if isinstance(x_vector_only_mode, str):
-            normalized = x_vector_only_mode.strip().lower()
-            if normalized in {"true", "1", "yes", "on"}:
-                x_vector_only_mode = True
-            elif normalized in {"false", "0", "no", "off"}:
-                x_vector_only_mode = False
-        if not isinstance(x_vector_only_mode, bool):
-            x_vector_only_mode = DEFAULT_CONFIG["qwenTts"]["xVectorOnlyMode"]
-        config["qwenTts"]["xVectorOnlyMode"] = x_vector_only_mode
+        config["qwenTts"].update(
+            _apply_schema(config["qwenTts"], DEFAULT_CONFIG["qwenTts"], QWEN_TTS_SCHEMA)
+        )
     else:
         normalized_tts_language = _normalize_tts_language(config.get("ttsLanguage"))
         if normalized_tts_language not in SUPPORTED_TTS_LANGUAGES:
@@ -601,7 +879,7 @@ def _load_active_config() -> dict:
         else:
             config["ttsLanguage"] = normalized_tts_language
 
-        if config["ttsModel"].startswith("Marvis-AI"):
+        if tts_kind == TTS_KIND_MARVIS:
             if config["ttsVoice"] not in MARVIS_VOICES:
                 config["ttsVoice"] = None
         else:
@@ -611,161 +889,32 @@ def _load_active_config() -> dict:
                     or DEFAULT_CONFIG["ttsVoice"]
                 )
 
-    def _parse_bool(value: object, fallback: bool) -> bool:
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, (int, float)):
-            return value != 0
-        if isinstance(value, str):
-            normalized = value.strip().lower()
-            if normalized in {"true", "1", "yes", "on"}:
-                return True
-            if normalized in {"false", "0", "no", "off"}:
-                return False
-        return fallback
-
-    def _parse_number(value: object, fallback: float) -> float:
-        if isinstance(value, bool):
-            return fallback
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            try:
-                return float(value)
-            except ValueError:
-                return fallback
-        return fallback
-
-    def _clamp_min(value: float, minimum: float) -> float:
-        return value if value >= minimum else minimum
-
-    def _clamp01(value: float) -> float:
-        return max(0.0, min(1.0, value))
-
-    turn_defaults = DEFAULT_CONFIG["turnTaking"]
     turn_config = config.get("turnTaking") if isinstance(config.get("turnTaking"), dict) else {}
-    vad_config = turn_config.get("vad") if isinstance(turn_config.get("vad"), dict) else {}
-    smart_config = (
-        turn_config.get("smartTurn") if isinstance(turn_config.get("smartTurn"), dict) else {}
-    )
+    normalized_turn_taking = {}
+    for section, schema in TURN_TAKING_SCHEMA.items():
+        values = turn_config.get(section) if isinstance(turn_config.get(section), dict) else {}
+        normalized_turn_taking[section] = _apply_schema(
+            values, DEFAULT_CONFIG["turnTaking"][section], schema
+        )
+    config["turnTaking"] = normalized_turn_taking
 
-    vad_confidence = _clamp01(
-        _parse_number(vad_config.get("confidence"), turn_defaults["vad"]["confidence"])
-    )
-    vad_start_secs = _clamp_min(
-        _parse_number(vad_config.get("startSecs"), turn_defaults["vad"]["startSecs"]), 0.0
-    )
-    vad_stop_secs = _clamp_min(
-        _parse_number(vad_config.get("stopSecs"), turn_defaults["vad"]["stopSecs"]), 0.0
-    )
-    vad_min_volume = _clamp01(
-        _parse_number(vad_config.get("minVolume"), turn_defaults["vad"]["minVolume"])
+    config["llmOllamaThink"] = _parse_flag(
+        config.get("llmOllamaThink"), DEFAULT_CONFIG["llmOllamaThink"]
     )
 
-    smart_enabled = _parse_bool(
-        smart_config.get("enabled"), turn_defaults["smartTurn"]["enabled"]
-    )
-    smart_stop_secs = _clamp_min(
-        _parse_number(smart_config.get("stopSecs"), turn_defaults["smartTurn"]["stopSecs"]), 0.0
-    )
-    smart_pre_speech_ms = _clamp_min(
-        _parse_number(
-            smart_config.get("preSpeechMs"), turn_defaults["smartTurn"]["preSpeechMs"]
-        ),
-        0.0,
-    )
-    smart_max_duration_secs = _clamp_min(
-        _parse_number(
-            smart_config.get("maxDurationSecs"),
-            turn_defaults["smartTurn"]["maxDurationSecs"],
-        ),
-        0.0,
-    )
-
-    config["turnTaking"] = {
-        "vad": {
-            "confidence": vad_confidence,
-            "startSecs": vad_start_secs,
-            "stopSecs": vad_stop_secs,
-            "minVolume": vad_min_volume,
-        },
-        "smartTurn": {
-            "enabled": smart_enabled,
-            "stopSecs": smart_stop_secs,
-            "preSpeechMs": smart_pre_speech_ms,
-            "maxDurationSecs": smart_max_duration_secs,
-        },
-    }
-
-    if config["llmProvider"] not in {"openai-compatible", "ollama"}:
-        config["llmProvider"] = DEFAULT_CONFIG["llmProvider"]
-
-    if not isinstance(config.get("llmBaseUrl"), str) or not config["llmBaseUrl"]:
-        config["llmBaseUrl"] = DEFAULT_CONFIG["llmBaseUrl"]
-
-    if not isinstance(config.get("llmModel"), str) or not config["llmModel"]:
-        config["llmModel"] = DEFAULT_CONFIG["llmModel"]
-
-    ollama_think = config.get("llmOllamaThink")
-    if isinstance(ollama_think, str):
-        normalized = ollama_think.strip().lower()
-        if normalized in {"true", "1", "yes", "on"}:
-            ollama_think = True
-        elif normalized in {"false", "0", "no", "off"}:
-            ollama_think = False
-    if not isinstance(ollama_think, bool):
-        ollama_think = DEFAULT_CONFIG["llmOllamaThink"]
-    config["llmOllamaThink"] = ollama_think
-
     ollama_options = (
         config.get("llmOllamaOptions")
         if isinstance(config.get("llmOllamaOptions"), dict)
         else {}
     )
     normalized_ollama_options = DEFAULT_CONFIG["llmOllamaOptions"].copy()
-
-    def _parse_optional_number(value: object):
-        if value is None or value == "":
-            return None
-        parsed = _parse_number(value, None)
-        if parsed is None or (isinstance(parsed, float) and math.isnan(parsed)):
-            return None
-        return parsed
-
-    def _parse_optional_int(value: object):
-        parsed = _parse_optional_number(value)
-        if parsed is None:
-            return None
-        try:
-            return int(parsed)
-        except (TypeError, ValueError):
-            return None
-
-    normalized_ollama_options["temperature"] = _parse_optional_number(
-        ollama_options.get("temperature")
-    )
-    normalized_ollama_options["top_k"] = _parse_optional_int(
-        ollama_options.get("topK", ollama_options.get("top_k"))
-    )
-    normalized_ollama_options["top_p"] = _parse_optional_number(
-        ollama_options.get("topP", ollama_options.get("top_p"))
-    )
-    normalized_ollama_options["min_p"] = _parse_optional_number(
-        ollama_options.get("minP", ollama_options.get("min_p"))
-    )
-    normalized_ollama_options["repeat_penalty"] = _parse_optional_number(
-        ollama_options.get("repeatPenalty", ollama_options.get("repeat_penalty"))
-    )
-    normalized_ollama_options["repeat_last_n"] = _parse_optional_int(
-        ollama_options.get("repeatLastN", ollama_options.get("repeat_last_n"))
-    )
-    normalized_ollama_options["seed"] = _parse_optional_int(ollama_options.get("seed"))
-    normalized_ollama_options["num_predict"] = _parse_optional_int(
-        ollama_options.get("numPredict", ollama_options.get("num_predict"))
-    )
-    normalized_ollama_options["num_ctx"] = _parse_optional_int(
-        ollama_options.get("numCtx", ollama_options.get("num_ctx"))
-    )
+    for key, aliases, parse in OLLAMA_OPTIONS_SCHEMA:
+        raw = None
+        for alias in aliases:
+            if alias in ollama_options:
+                raw = ollama_options[alias]
+                break
+        normalized_ollama_options[key] = parse(raw)
 
     stop_value = ollama_options.get("stop")
     if isinstance(stop_value, list):
@@ -778,168 +927,260 @@ def _load_active_config() -> dict:
 
     config["llmOllamaOptions"] = normalized_ollama_options
 
-    if not isinstance(config.get("systemPrompt"), str) or not config["systemPrompt"].strip():
-        config["systemPrompt"] = DEFAULT_CONFIG["systemPrompt"]
-
-    if not isinstance(config.get("ttsSentenceStreaming"), bool):
-        config["ttsSentenceStreaming"] = DEFAULT_CONFIG["ttsSentenceStreaming"]
+    _intern_strings(config, _INTERNED_CONFIG_KEYS)
+    if tts_kind == TTS_KIND_QWEN:
+        _intern_strings(config["qwenTts"], _INTERNED_QWEN_TTS_KEYS)
 
     return config
 
 
+_QWEN_TTS_KEYS = tuple(sorted(DEFAULT_CONFIG["qwenTts"]))
+
+
 def _warmup_signature(config: dict) -> tuple:
+    # The signature keys _WARMED_SERVICES, so it holds only validated,
+    # hashable values: qwenTts is normalized only for Qwen models, and
+    # ttsVoice/ttsLanguage only for the others (Qwen doesn't use them).
+    if config["_ttsKind"] == TTS_KIND_QWEN:
+        qwen_tts = config["qwenTts"]
+        return (
+            config.get("whisperModel"),
+            config.get("whisperLanguage"),
+            config.get("ttsModel"),
+            None,
+            None,
+            tuple((key, qwen_tts.get(key)) for key in _QWEN_TTS_KEYS),
+        )
     return (
         config.get("whisperModel"),
         config.get("whisperLanguage"),
         config.get("ttsModel"),
         config.get("ttsLanguage"),
         config.get("ttsVoice"),
-        json.dumps(config.get("qwenTts", {}), sort_keys=True),
+        (),
     )
 
 
-async def _warmup_stt_service(stt: WhisperSTTServiceMLX) -> None:
-    # 1 second of 16-bit PCM silence at 16kHz.
-    silence = b"\x00" * (16000 * 2)
-    async for _ in stt.run_stt(silence):
-        break
+def _ollama_extra_body(config: dict) -> dict:
+    """Request extra_body for Ollama: the think flag plus non-empty options."""
+    ollama_options = {}
+    raw_options = config.get("llmOllamaOptions")
+    if isinstance(raw_options, dict):
+        for key, value in raw_options.items():
+            if value is None:
+                continue
+            if isinstance(value, str) and not value.strip():
+                continue
+            if key == "stop" and isinstance(value, str):
+                split_values = [
+                    chunk.strip()
+                    for chunk in value.replace("\n", ",").split(",")
+                    if chunk.strip()
+                ]
+                if len(split_values) == 1:
+                    ollama_options[key] = split_values[0]
+                elif len(split_values) > 1:
+                    ollama_options[key] = split_values
+                continue
+            ollama_options[key] = value
+    extra_body = {"think": config.get("llmOllamaThink", True)}
+    if ollama_options:
+        extra_body["options"] = ollama_options
+    return extra_body
+
+
+def _acquire_analyzer(key: tuple, factory: Callable[[], object]) -> object:
+    idle = _ANALYZER_POOL.get(key)
+    if idle:
+        return idle.pop()
+    return factory()
+
+
+def _release_analyzer(key: tuple, analyzer: Optional[object]) -> None:
+    if analyzer is None:
+        return
+    clear = getattr(analyzer, "clear", None)
+    if callable(clear):
+        try:
+            clear()
+        except Exception as exc:
+            logger.warning(f"Dropping analyzer that failed to clear: {exc}")
+            return
+    _ANALYZER_POOL.setdefault(key, []).append(analyzer)
 
 
-async def _warmup_models(config: dict) -> None:
-    stt = WhisperSTTServiceMLX(
-        model=config["whisperModel"],
-        language=LANGUAGE_MAP.get(config["whisperLanguage"], Language.EN),
+AnalyzerSpec = Tuple[tuple, Callable[[], object]]
+
+
+def _turn_analyzer_specs(config: dict) -> Tuple[AnalyzerSpec, Optional[AnalyzerSpec]]:
+    """Return (pool key, factory) for the VAD and (if enabled) smart-turn analyzers."""
+    # turnTaking is fully populated by _parse_active_config.
+    vad_config = config["turnTaking"]["vad"]
+    smart_config = config["turnTaking"]["smartTurn"]
+    vad_params = VADParams(
+        confidence=vad_config["confidence"],
+        start_secs=vad_config["startSecs"],
+        stop_secs=vad_config["stopSecs"],
+        min_volume=vad_config["minVolume"],
+    )
+
+    def _new_vad_analyzer():
+        from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+        return SileroVADAnalyzer(params=vad_params)
+
+    vad_key = (
+        "vad",
+        vad_params.confidence,
+        vad_params.start_secs,
+        vad_params.stop_secs,
+        vad_params.min_volume,
     )
 
-    is_qwen_model = config["ttsModel"].startswith("mlx-community/Qwen3-TTS")
-    tts_language = (
-        config.get("ttsLanguage") if config["ttsModel"].startswith("Marvis-AI") else None
+    if not smart_config["enabled"]:
+        return (vad_key, _new_vad_analyzer), None
+
+    smart_turn_params = SmartTurnParams(
+        stop_secs=smart_config["stopSecs"],
+        pre_speech_ms=smart_config["preSpeechMs"],
+        max_duration_secs=smart_config["maxDurationSecs"],
+    )
+
+    def _new_turn_analyzer():
+        _install_transformers_shim()
+        from pipecat.audio.turn.smart_turn.local_smart_turn_v2 import LocalSmartTurnAnalyzerV2
+
+        return LocalSmartTurnAnalyzerV2(
+            smart_turn_model_path="",  # Download from HuggingFace
+            params=smart_turn_params,
+        )
+
+    turn_key = (
+        "smartTurn",
+        smart_turn_params.stop_secs,
+        smart_turn_params.pre_speech_ms,
+        smart_turn_params.max_duration_secs,
     )
-    qwen_settings = config.get("qwenTts") if is_qwen_model else None
-    tts_model_name = (
-        config["qwenTts"]["model"]
-        if is_qwen_model and isinstance(config.get("qwenTts"), dict)
-        else config["ttsModel"]
+    return (vad_key, _new_vad_analyzer), (turn_key, _new_turn_analyzer)
+
+
+async def _prefill_analyzers(config: dict) -> None:
+    """Load one idle VAD / smart-turn analyzer for `config` into the pool."""
+    for spec in config["_analyzerSpecs"]:
+        if spec is None:
+            continue
+        key, factory = spec
+        if _ANALYZER_POOL.get(key):
+            continue
+        analyzer = await asyncio.to_thread(factory)
+        _release_analyzer(key, analyzer)
+
+
+def _build_stt_service(config: dict) -> "WhisperSTTServiceMLX":
+    from pipecat.services.whisper.stt import WhisperSTTServiceMLX
+
+    # Utterances arrive one at a time from the VAD, so there is nothing to
+    # batch; mlx_whisper already uses fused SDPA attention. Pin greedy
+    # single-pass decoding so a low-confidence segment never triggers the
+    # temperature-fallback re-decodes.
+    return WhisperSTTServiceMLX(
+        model=config["whisperModel"],
+        language=config["_whisperLanguageEnum"],
+        temperature=0.0,
     )
-    tts = TTSMLXIsolated(
-        model=tts_model_name,
+
+
+def _build_tts_service(config: dict):
+    from tts_mlx_isolated import TTSMLXIsolated
+
+    tts_kind = config["_ttsKind"]
+    is_qwen_model = tts_kind == TTS_KIND_QWEN
+    return TTSMLXIsolated(
+        model=config["qwenTts"]["model"] if is_qwen_model else config["ttsModel"],
         voice=None if is_qwen_model else config["ttsVoice"],
-        language=tts_language,
-        qwen_settings=qwen_settings,
+        language=config.get("ttsLanguage") if tts_kind == TTS_KIND_MARVIS else None,
+        qwen_settings=config["qwenTts"] if is_qwen_model else None,
         sample_rate=24000,
         sentence_streaming_enabled=config["ttsSentenceStreaming"],
         aggregate_sentences=False,
     )
 
-    await asyncio.gather(_warmup_stt_service(stt), tts.warmup())
+
+def _build_services(config: dict) -> tuple:
+    """(stt, tts) for `config`; the one place warmup and run_bot build them."""
+    return _build_stt_service(config), _build_tts_service(config)
+
+
+# 1 second of 16-bit PCM silence at 16kHz.
+_SILENCE_16K_1S = bytes(16000 * 2)
+
+
+async def _warmup_stt_service(stt: "WhisperSTTServiceMLX") -> None:
+    results = stt.run_stt(_SILENCE_16K_1S)
+    try:
+        await results.__anext__()
+    except StopAsyncIteration:
+        pass
+    finally:
+        await results.aclose()
+
+
+async def _warmup_models(config: dict) -> None:
+    stt, tts = _build_services(config)
+
     qwen_mode = None
-    if is_qwen_model and isinstance(qwen_settings, dict):
-        qwen_mode = qwen_settings.get("mode")
-    if qwen_mode != "voiceCloning":
-        await tts.warmup_generate("Hello")
+    if config["_ttsKind"] == TTS_KIND_QWEN:
+        qwen_mode = config["qwenTts"].get("mode")
+
+    async def _warmup_tts() -> None:
+        await tts.warmup()
+        if qwen_mode != "voiceCloning":
+            await tts.warmup_generate("Hello")
+
+    # The first synthesis overlaps with Whisper's warmup rather than
+    # waiting for it.
+    await asyncio.gather(_warmup_stt_service(stt), _warmup_tts(), _prefill_analyzers(config))
+    # Keep only the newest warmed pair; older ones hold no extra resources
+    # (weights and TTS workers are shared per model) and are just dropped.
+    _WARMED_SERVICES.clear()
+    _WARMED_SERVICES[config["_warmupSignature"]] = (stt, tts)
 
 
 async def run_bot(webrtc_connection):
-    config = _load_active_config()
-    turn_config = config.get("turnTaking", {})
-    vad_config = turn_config.get("vad", {}) if isinstance(turn_config, dict) else {}
-    smart_config = (
-        turn_config.get("smartTurn", {}) if isinstance(turn_config, dict) else {}
-    )
-    vad_params = VADParams(
-        confidence=vad_config.get("confidence", DEFAULT_CONFIG["turnTaking"]["vad"]["confidence"]),
-        start_secs=vad_config.get("startSecs", DEFAULT_CONFIG["turnTaking"]["vad"]["startSecs"]),
-        stop_secs=vad_config.get("stopSecs", DEFAULT_CONFIG["turnTaking"]["vad"]["stopSecs"]),
-        min_volume=vad_config.get("minVolume", DEFAULT_CONFIG["turnTaking"]["vad"]["minVolume"]),
-    )
-    smart_turn_enabled = smart_config.get(
-        "enabled", DEFAULT_CONFIG["turnTaking"]["smartTurn"]["enabled"]
-    )
-    smart_turn_params = (
-        SmartTurnParams(
-            stop_secs=smart_config.get(
-                "stopSecs", DEFAULT_CONFIG["turnTaking"]["smartTurn"]["stopSecs"]
-            ),
-            pre_speech_ms=smart_config.get(
-                "preSpeechMs", DEFAULT_CONFIG["turnTaking"]["smartTurn"]["preSpeechMs"]
-            ),
-            max_duration_secs=smart_config.get(
-                "maxDurationSecs", DEFAULT_CONFIG["turnTaking"]["smartTurn"]["maxDurationSecs"]
-            ),
-        )
-        if smart_turn_enabled
-        else None
-    )
-    turn_analyzer = (
-        LocalSmartTurnAnalyzerV2(
-            smart_turn_model_path="",  # Download from HuggingFace
-            params=smart_turn_params,
-        )
-        if smart_turn_enabled
-        else None
-    )
+    config = await _load_active_config_async()
+    # Let an in-flight warmup of this same config finish first, so the first
+    # peer reuses the weights it loaded instead of loading them again in
+    # parallel. asyncio.wait neither raises if the warmup fails or is
+    # cancelled nor cancels it if this bot is torn down while waiting.
+    warmup = WARMUP_TASK
+    if warmup is not None and WARMUP_SIGNATURE == config["_warmupSignature"]:
+        await asyncio.wait({warmup})
+
+    vad_spec, turn_spec = config["_analyzerSpecs"]
+    vad_analyzer = _acquire_analyzer(*vad_spec)
+    turn_analyzer = _acquire_analyzer(*turn_spec) if turn_spec else None
 
     transport = SmallWebRTCTransport(
         webrtc_connection=webrtc_connection,
         params=TransportParams(
             audio_in_enabled=True,
             audio_out_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(params=vad_params),
+            vad_analyzer=vad_analyzer,
             turn_analyzer=turn_analyzer,
         ),
     )
-    stt = WhisperSTTServiceMLX(
-        model=config["whisperModel"],
-        language=LANGUAGE_MAP.get(config["whisperLanguage"], Language.EN),
-    )
-
-    is_qwen_model = config["ttsModel"].startswith("mlx-community/Qwen3-TTS")
-    tts_language = config.get("ttsLanguage") if config["ttsModel"].startswith("Marvis-AI") else None
-    qwen_settings = config.get("qwenTts") if is_qwen_model else None
-    tts_model_name = (
-        config["qwenTts"]["model"]
-        if is_qwen_model and isinstance(config.get("qwenTts"), dict)
-        else config["ttsModel"]
-    )
-    tts = TTSMLXIsolated(
-        model=tts_model_name,
-        voice=None if is_qwen_model else config["ttsVoice"],
-        language=tts_language,
-        qwen_settings=qwen_settings,
-        sample_rate=24000,
-        sentence_streaming_enabled=config["ttsSentenceStreaming"],
-        aggregate_sentences=False,
-    )
+    # A pipeline owns its processors, so warmed services go to one peer only.
+    warmed = _WARMED_SERVICES.pop(config["_warmupSignature"], None)
+    if warmed is not None:
+        stt, tts = warmed
+    else:
+        stt, tts = _build_services(config)
 
     llm_params = None
     if config["llmProvider"] == "ollama":
-        ollama_think = config.get("llmOllamaThink", True)
-        logger.info(f"Ollama think enabled: {ollama_think}")
-        ollama_options = {}
-        raw_options = config.get("llmOllamaOptions")
-        if isinstance(raw_options, dict):
-            for key, value in raw_options.items():
-                if value is None:
-                    continue
-                if isinstance(value, str) and not value.strip():
-                    continue
-                if key == "stop" and isinstance(value, str):
-                    split_values = [
-                        chunk.strip()
-                        for chunk in value.replace("\n", ",").split(",")
-                        if chunk.strip()
-                    ]
-                    if len(split_values) == 1:
-                        ollama_options[key] = split_values[0]
-                    elif len(split_values) > 1:
-                        ollama_options[key] = split_values
-                    continue
-                ollama_options[key] = value
-        extra_body = {"think": ollama_think}
-        if ollama_options:
-            extra_body["options"] = ollama_options
+        logger.info(f"Ollama think enabled: {config.get('llmOllamaThink', True)}")
         llm_params = BaseOpenAILLMService.InputParams(
-            extra={"extra_body": extra_body}
+            extra={"extra_body": config["_ollamaExtraBody"]}
         )
 
     llm_service = LoggingOpenAILLMService if config["llmProvider"] == "ollama" else OpenAILLMService
@@ -954,14 +1195,12 @@ async def run_bot(webrtc_connection):
         log_raw_chunks=False,
     )
 
-    context = OpenAILLMContext(
-        [
-            {
-                "role": "user",
-                "content": config["systemPrompt"],
-            }
-        ],
-    )
+    system_prompt = config["systemPrompt"]
+    if system_prompt == DEFAULT_SYSTEM_PROMPT:
+        messages = list(_DEFAULT_SYSTEM_MESSAGES)
+    else:
+        messages = [{"role": "user", "content": system_prompt}]
+    context = OpenAILLMContext(messages)
     context_aggregator = llm.create_context_aggregator(
         context,
         # Whisper local service isn't streaming, so it delivers the full text all at
@@ -994,22 +1233,6 @@ async def run_bot(webrtc_connection):
         ]
     )
 
-    class FilteredRTVIObserver(RTVIObserver):
-        def __init__(self, *args, llm_sources=None, llm_destinations=None, **kwargs):
-            super().__init__(*args, **kwargs)
-            self._llm_sources = set(llm_sources or [])
-            self._llm_destinations = set(llm_destinations or [])
-
-        async def on_push_frame(self, data):
-            if isinstance(data.frame, LLMTextFrame):
-                if self._llm_sources and data.source not in self._llm_sources:
-                    self._frames_seen.add(data.frame.id)
-                    return
-                if self._llm_destinations and data.destination not in self._llm_destinations:
-                    self._frames_seen.add(data.frame.id)
-                    return
-            await super().on_push_frame(data)
-
     task = PipelineTask(
         pipeline,
         params=PipelineParams(
@@ -1039,25 +1262,50 @@ async def run_bot(webrtc_connection):
 
     @transport.event_handler("on_first_participant_joined")
     async def on_first_participant_joined(transport, participant):
-        print(f"Participant joined: {participant}")
+        logger.info("Participant joined: {}", participant)
         await transport.capture_participant_transcription(participant["id"])
 
     @transport.event_handler("on_participant_left")
     async def on_participant_left(transport, participant, reason):
-        print(f"Participant left: {participant}")
+        logger.info("Participant left: {}", participant)
         await task.cancel()
 
     runner = PipelineRunner(handle_sigint=False)
 
-    await runner.run(task)
+    try:
+        await runner.run(task)
+    finally:
+        _release_analyzer(vad_spec[0], vad_analyzer)
+        if turn_spec:
+            _release_analyzer(turn_spec[0], turn_analyzer)
+        # A pipeline can end without the peer's "closed" event (errors,
+        # participant left); drop the connection with it so pcs_map only
+        # ever holds peers that still have a bot.
+        if pcs_map.get(webrtc_connection.pc_id) is webrtc_connection:
+            del pcs_map[webrtc_connection.pc_id]
+            await _disconnect_peer(webrtc_connection)
 
 
 @app.post("/api/offer")
-async def offer(request: dict, background_tasks: BackgroundTasks):
+async def offer(request: dict):
     pc_id = request.get("pc_id")
 
-    if pc_id and pc_id in pcs_map:
-        pipecat_connection = pcs_map[pc_id]
+    if not pc_id:
+        return await _handle_offer(request, None)
+    # Offers naming an existing peer are serialized so a renegotiation can't race
+    # another offer for the same pc_id and start a duplicate connection.
+    async with pcs_lock:
+        return await _handle_offer(request, pc_id)
+
+
+async def _handle_offer(request: dict, pc_id: Optional[str]) -> dict:
+    # initialize()/renegotiate() are native aiortc coroutines (ICE/DTLS run on
+    # the loop's own I/O) and get_answer() only reads the local description,
+    # so nothing here is pushed to a thread; the timing is logged at DEBUG
+    # (IARA_LOG_LEVEL=DEBUG) so regressions show up there.
+    started = time.perf_counter()
+    pipecat_connection = pcs_map.get(pc_id) if pc_id else None
+    if pipecat_connection is not None:
         logger.info(f"Reusing existing connection for pc_id: {pc_id}")
         await pipecat_connection.renegotiate(
             sdp=request["sdp"],
@@ -1072,17 +1320,39 @@ async def offer(request: dict, background_tasks: BackgroundTasks):
         async def handle_disconnected(webrtc_connection: SmallWebRTCConnection):
             logger.info(f"Discarding peer connection for pc_id: {webrtc_connection.pc_id}")
             pcs_map.pop(webrtc_connection.pc_id, None)
-
-        # Run example function with SmallWebRTC transport arguments.
-        background_tasks.add_task(run_bot, pipecat_connection)
+            bot = bot_tasks.get(webrtc_connection.pc_id)
+            if bot is not None:
+                bot.cancel()
 
     answer = pipecat_connection.get_answer()
     # Updating the peer connection inside the map
     pcs_map[answer["pc_id"]] = pipecat_connection
+    if answer["pc_id"] not in bot_tasks:
+        _start_bot(answer["pc_id"], pipecat_connection)
+    logger.debug(
+        "Handled offer for pc_id {} in {:.1f} ms",
+        answer["pc_id"],
+        (time.perf_counter() - started) * 1000,
+    )
 
     return answer
 
 
+def _start_bot(pc_id: str, webrtc_connection: SmallWebRTCConnection) -> None:
+    # A standalone task (rather than a request BackgroundTask) per peer, so the
+    # closed handler and shutdown can cancel it directly.
+    bot = asyncio.create_task(run_bot(webrtc_connection), name=f"bot-{pc_id}")
+    bot_tasks[pc_id] = bot
+
+    def _forget(finished: asyncio.Task) -> None:
+        if bot_tasks.get(pc_id) is finished:
+            del bot_tasks[pc_id]
+        if not finished.cancelled() and finished.exception() is not None:
+            logger.opt(exception=finished.exception()).error(f"Bot for pc_id {pc_id} failed")
+
+    bot.add_done_callback(_forget)
+
+
 async def _run_warmup(config: dict, signature: tuple) -> None:
     global WARMUP_SIGNATURE, WARMUP_TASK
     try:
@@ -1102,8 +1372,8 @@ async def _run_warmup(config: dict, signature: tuple) -> None:
 async def warmup_models():
     global WARMUP_SIGNATURE, WARMUP_TASK
 
-    config = _load_active_config()
-    signature = _warmup_signature(config)
+    config = await _load_active_config_async()
+    signature = config["_warmupSignature"]
 
     if WARMUP_STATE["status"] == "ready" and signature == WARMUP_SIGNATURE:
         return WARMUP_STATE
@@ -1123,15 +1393,18 @@ async def warmup_models():
     return WARMUP_STATE
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    yield  # Run app
-    coros = [pc.disconnect() for pc in pcs_map.values()]
-    await asyncio.gather(*coros)
-    pcs_map.clear()
+@app.post("/api/config/reload")
+async def reload_config():
+    """Drop the cached config and re-parse the config file."""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
+    await _load_active_config_async()
+    return {"status": "ok"}
 
 
 if __name__ == "__main__":
+    _init_env()
+
     def _env_port(default: int) -> int:
         raw = os.environ.get("IARA_SERVER_PORT") or os.environ.get("PORT")
         if not raw:
@@ -1159,4 +1432,5 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    uvicorn.run(app, host=args.host, port=args.port)
+    # uvloop + httptools come with uvicorn[standard] (pulled in by fastapi[all]).
+    uvicorn.run(app, host=args.host, port=args.port, loop="uvloop", http="httptools")
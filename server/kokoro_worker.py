@@ -3,7 +3,7 @@
 Standalone Kokoro TTS worker process.
 
 This worker runs in complete isolation to avoid Metal threading conflicts.
-It communicates via JSON over stdin/stdout.
+It reads JSON commands on stdin and answers with binary frames on stdout.
 
 Usage:
     python kokoro_worker.py
@@ -11,15 +11,21 @@ Usage:
 Commands:
     {"cmd": "init", "model": "mlx-community/Kokoro-82M-bf16", "voice": "af_heart"}
     {"cmd": "generate", "text": "Hello world"}
+    {"cmd": "warmup", "text": "Hello"}   # generate, but only the final frame is sent
+
+Responses are framed on stdout (see tts_ipc.py): "generate" sends PCM frames
+as segments are synthesized (very short ones are coalesced) and ends with a
+{"success": true, "final": true} JSON frame (or a single {"error": ...}).
 """
 
-import sys
-import json
-import base64
-import traceback
 import inspect
 import numpy as np
 import os
+import time
+from collections.abc import Sequence
+
+from tts_buffers import BufferPool, to_pcm, warm_pcm_packer
+from tts_ipc import CommandReader, error_response, loads, open_frame_stream, write_json, write_responses
 
 # Add logging to worker
 import logging
@@ -42,6 +48,34 @@ try:
 except Exception:
     pass
 
+# Segments between mx.clear_cache() calls while streaming a generate.
+_CLEAR_CACHE_EVERY = 25
+
+# Generates that ran at least this long (seconds) release MLX's buffer cache
+# when they end, so peak working sets don't ratchet up the worker's memory;
+# shorter ones keep it warm for the next.
+_CLEAR_CACHE_AFTER_SECONDS = 0.2
+
+# Loaded models by name, so a repeated init only re-binds voice/language.
+_MODEL_CACHE = {}
+
+_LANG_CODES = frozenset({"a", "b", "j", "z", "e", "f", "h", "i", "p"})
+_LANGUAGE_TO_LANG_CODE = {
+    "en-us": "a",
+    "en": "a",
+    "en-gb": "b",
+    "ja": "j",
+    "zh": "z",
+    "es": "e",
+    "fr": "f",
+    "hi": "h",
+    "it": "i",
+    "pt-br": "p",
+    "pt": "p",
+    "pt_br": "p",
+    "ptbr": "p",
+}
+
 def _coerce_g2p_result(result):
     if isinstance(result, tuple):
         if len(result) >= 2:
@@ -52,9 +86,7 @@ def _coerce_g2p_result(result):
     if isinstance(result, str):
         return result, None
     try:
-        from collections.abc import Sequence as _Seq
-
-        if isinstance(result, _Seq) and not isinstance(result, (str, bytes)):
+        if isinstance(result, Sequence) and not isinstance(result, (str, bytes)):
             if len(result) >= 2:
                 return result[0], result[1]
             if len(result) == 1:
@@ -127,16 +159,24 @@ class Worker:
         self.available_voices = None
         self.inferred_language = None
         self.lang_code = None
+        self._base_kwargs = {}
+        self._pool = BufferPool()
         
     def initialize(self, model_name, voice, language=None):
         if not MLX_AVAILABLE:
             return {"error": "MLX not available"}
         try:
-            self.model = load_model(model_name)
+            cached = _MODEL_CACHE.get(model_name)
+            self.model = cached if cached is not None else load_model(model_name)
+            _MODEL_CACHE[model_name] = self.model
+            warm_pcm_packer()
             self.voice = voice
             self.language = language
             self.inferred_language = self._infer_language_from_voice(voice)
             self.lang_code = self._resolve_lang_code()
+            self._base_kwargs = {"voice": voice, "speed": 1.0}
+            if self.lang_code and self._generate_accepts("lang_code"):
+                self._base_kwargs["lang_code"] = self.lang_code
             self.available_voices = self._get_available_voices()
             if self.available_voices is not None:
                 logging.info(f"Available voices: {self.available_voices}")
@@ -145,14 +185,16 @@ class Worker:
                         "error": f"Voice '{voice}' not available in model.",
                         "availableVoices": self.available_voices,
                     }
-            # Test generation to ensure everything works (try with lang_code, fallback without)
-            try:
-                list(self.model.generate(**self._build_generate_kwargs(text="test")))
-            except TypeError:
-                list(self.model.generate(text="test", voice=self.voice, speed=1.0))
+            if self._generate_params() is None:
+                # No explicit parameter list to check the kwargs against:
+                # creating the generator is enough to surface a rejected
+                # argument set without synthesizing throwaway audio.
+                gen = self.model.generate(**self._build_generate_kwargs(text="test"))
+                if hasattr(gen, "close"):
+                    gen.close()
             return {"success": True}
         except Exception as e:
-            return {"error": f"{str(e)}\n{traceback.format_exc()}"}
+            return error_response(e)
 
     def _get_available_voices(self):
         if not self.model:
@@ -193,24 +235,9 @@ class Worker:
         if not language or not isinstance(language, str):
             return None
         normalized = language.strip().lower()
-        if normalized in {"a", "b", "j", "z", "e", "f", "h", "i", "p"}:
+        if normalized in _LANG_CODES:
             return normalized
-        mapping = {
-            "en-us": "a",
-            "en": "a",
-            "en-gb": "b",
-            "ja": "j",
-            "zh": "z",
-            "es": "e",
-            "fr": "f",
-            "hi": "h",
-            "it": "i",
-            "pt-br": "p",
-            "pt": "p",
-            "pt_br": "p",
-            "ptbr": "p",
-        }
-        return mapping.get(normalized)
+        return _LANGUAGE_TO_LANG_CODE.get(normalized)
 
     def _resolve_lang_code(self):
         # Hard-force Brazilian Portuguese for pf_/pm_ voices.
@@ -221,76 +248,132 @@ class Worker:
             or self.inferred_language
         )
 
+    def _generate_params(self):
+        """Explicit parameter names of model.generate, or None if it can't be told."""
+        try:
+            params = inspect.signature(self.model.generate).parameters
+        except (TypeError, ValueError):
+            return None
+        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+            return None
+        return params
+
+    def _generate_accepts(self, name):
+        """Whether model.generate takes `name`, checked once at init."""
+        params = self._generate_params()
+        return params is None or name in params
+
     def _build_generate_kwargs(self, *, text):
-        kwargs = {"text": text, "voice": self.voice, "speed": 1.0}
-        lang_code = self.lang_code or self._resolve_lang_code()
-        if lang_code:
-            kwargs["lang_code"] = lang_code
-        return kwargs
+        return {"text": text, **self._base_kwargs}
     
+    def warmup(self, text="Hello"):
+        """Synthesize `text` and discard the audio, compiling kernels up front."""
+        for resp in self.generate(text):
+            if isinstance(resp, dict):
+                return resp
+        return {"error": "No audio"}
+
     def generate(self, text):
+        """Yield one response per synthesized segment, then a final marker.
+
+        Leading silent segments are held back until audible audio arrives, so
+        an all-silent result still ends in a single error and no audio.
+        """
+        started = time.monotonic()
         try:
             if not self.model:
-                return {"error": "Not initialized"}
-            
-            segments = []
-            lang_code = self.lang_code or self._resolve_lang_code()
-            logging.info(f"Using lang_code={lang_code} for voice={self.voice}")
-            try:
-                iterator = self.model.generate(**self._build_generate_kwargs(text=text))
-            except TypeError:
-                iterator = self.model.generate(text=text, voice=self.voice, speed=1.0)
-            for result in iterator:
-                # Convert MLX array to numpy immediately
-                audio_data = np.array(result.audio, copy=True)
-                print(f"Generated segment shape: {audio_data.shape}, min: {audio_data.min():.4f}, max: {audio_data.max():.4f}", file=sys.stderr)
-                segments.append(audio_data)
-            
-            if not segments:
-                return {"error": "No audio"}
-                
-            # Concatenate all segments
-            if len(segments) == 1:
-                audio = segments[0]
+                yield {"error": "Not initialized"}
+                return
+
+            logging.info(f"Using lang_code={self._base_kwargs.get('lang_code')} for voice={self.voice}")
+            iterator = self.model.generate(**self._build_generate_kwargs(text=text))
+
+            produced = False
+            held_silence = []
+            for index, result in enumerate(iterator):
+                # Evaluate each segment as it arrives so the lazy graph stays
+                # shallow, and release cached Metal buffers periodically.
+                if isinstance(result.audio, mx.array):
+                    mx.eval(result.audio)
+                if (index + 1) % _CLEAR_CACHE_EVERY == 0 and hasattr(mx, "clear_cache"):
+                    mx.clear_cache()
+                # View the MLX output as numpy without copying it
+                audio_data = _as_numpy(result.audio)
+                if audio_data.size == 0:
+                    continue
+                produced = True
+                logging.debug("Generated segment shape: %s", audio_data.shape)
+                pcm, peak = to_pcm(audio_data, self._pool)
+                if held_silence is not None:
+                    if peak < 1e-6:
+                        held_silence.append(pcm)
+                        continue
+                    yield from held_silence
+                    held_silence = None
+                yield pcm
+
+            if not produced:
+                yield {"error": "No audio"}
+            elif held_silence is not None:
+                yield {"error": "Generated audio is silent"}
             else:
-                audio = np.concatenate(segments, axis=0)
-            
-            print(f"Final audio shape: {audio.shape}, min: {audio.min():.4f}, max: {audio.max():.4f}", file=sys.stderr)
-            
-            # Check if audio is silent
-            if np.max(np.abs(audio)) < 1e-6:
-                return {"error": "Generated audio is silent"}
-            
-            # Convert to 16-bit PCM
-            audio_int16 = (audio * 32767).astype(np.int16)
-            audio_b64 = base64.b64encode(audio_int16.tobytes()).decode()
-            
-            return {"success": True, "audio": audio_b64}
+                yield {"success": True, "final": True}
         except Exception as e:
-            import traceback
-            return {"error": f"{str(e)}\n{traceback.format_exc()}"}
+            yield error_response(e)
+        finally:
+            if (
+                MLX_AVAILABLE
+                and hasattr(mx, "clear_cache")
+                and time.monotonic() - started >= _CLEAR_CACHE_AFTER_SECONDS
+            ):
+                mx.clear_cache()
+
+
+def _as_numpy(audio):
+    """Flat numpy view of an evaluated MLX segment, copying only as a fallback."""
+    try:
+        return np.asarray(memoryview(audio)).reshape(-1)
+    except (TypeError, ValueError, BufferError):
+        return np.array(audio, copy=True).reshape(-1)
 
 
 def main():
     """Main worker loop - reads commands from stdin, writes responses to stdout."""
+    frames = open_frame_stream()
     worker = Worker()
+    preload = os.environ.get("IARA_PRELOAD_MODEL")
+    if preload:
+        # Load and warm before the parent's first command arrives.
+        status = worker.initialize(preload, os.environ.get("IARA_PRELOAD_VOICE", "af_heart"))
+        if status.get("success"):
+            status = worker.warmup()
+        logging.info(f"Preloaded {preload}: {status}")
+    
+    commands = CommandReader()
     
-    for line in sys.stdin:
+    for line in commands:
         try:
-            req = json.loads(line.strip())
+            req = loads(line)
+            if req["cmd"] == "cancel":
+                # Arrived after its generate finished; nothing to stop.
+                continue
             if req["cmd"] == "init":
-                resp = worker.initialize(
-                    req["model"],
-                    req["voice"],
-                    req.get("language"),
-                )
+                responses = [
+                    worker.initialize(
+                        req["model"],
+                        req["voice"],
+                        req.get("language"),
+                    )
+                ]
             elif req["cmd"] == "generate":
-                resp = worker.generate(req["text"])
+                responses = worker.generate(req["text"])
+            elif req["cmd"] == "warmup":
+                responses = [worker.warmup(req.get("text") or "Hello")]
             else:
-                resp = {"error": "Unknown command"}
-            print(json.dumps(resp), flush=True)
+                responses = [{"error": "Unknown command"}]
+            write_responses(frames, responses, commands)
         except Exception as e:
-            print(json.dumps({"error": str(e)}), flush=True)
+            write_json(frames, error_response(e))
 
 
 if __name__ == "__main__":
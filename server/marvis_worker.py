@@ -3,7 +3,7 @@
 Standalone Kokoro TTS worker process.
 
 This worker runs in complete isolation to avoid Metal threading conflicts.
-It communicates via JSON over stdin/stdout.
+It reads JSON commands on stdin and answers with binary frames on stdout.
 
 Usage:
     python kokoro_worker.py
@@ -11,13 +11,19 @@ Usage:
 Commands:
     {"cmd": "init", "model": "Marvis-AI/marvis-tts-250m-v0.1-MLX-fp16"}
     {"cmd": "generate", "text": "Hello world"}
+    {"cmd": "warmup", "text": "Hello"}   # generate, but only the final frame is sent
+
+Responses are framed on stdout (see tts_ipc.py): "generate" sends the whole
+utterance as one PCM frame followed by a {"success": true, "final": true}
+JSON frame (or a single {"error": ...}).
 """
 
 import sys
-import json
-import base64
+import time
 import numpy as np
 
+from tts_ipc import error_response, loads, open_frame_stream, write_json, write_pcm
+
 # Add logging to worker
 import logging
 
@@ -31,6 +37,14 @@ try:
 except ImportError:
     MLX_AVAILABLE = False
 
+# Rough output length per input character at 24 kHz, used to size the buffer.
+_SAMPLES_PER_CHAR_ESTIMATE = 2000
+
+# Generates that ran at least this long (seconds) release MLX's buffer cache
+# when they end, so peak working sets don't ratchet up the worker's memory;
+# shorter ones keep it warm for the next.
+_CLEAR_CACHE_AFTER_SECONDS = 0.2
+
 
 def rms_norm(audio: np.ndarray, target_rms: float = 0.1, eps: float = 1e-8) -> np.ndarray:
     """RMS normalize audio while ensuring no clipping beyond [-1, 1].
@@ -68,31 +82,40 @@ class Worker:
             list(self.model.generate(text="test", voice=self.voice, speed=1.0))
             return {"success": True}
         except Exception as e:
-            return {"error": str(e)}
+            return error_response(e)
 
     def generate(self, text):
+        started = time.monotonic()
         try:
             if not self.model:
                 return {"error": "Not initialized"}
 
-            segments = []
+            # Segments are copied straight into one output buffer sized from
+            # the text, growing geometrically only if the estimate falls short.
+            buffer = None
+            total = 0
             for result in self.model.generate(text=text, voice=self.voice, speed=1.0):
-                # Convert MLX array to numpy immediately
-                audio_data = np.array(result.audio, copy=True)
+                audio_data = np.asarray(result.audio).reshape(-1)
                 print(
                     f"Generated segment shape: {audio_data.shape}, min: {audio_data.min():.4f}, max: {audio_data.max():.4f}",
                     file=sys.stderr,
                 )
-                segments.append(audio_data)
-
-            if not segments:
+                end = total + audio_data.size
+                if buffer is None or end > buffer.size:
+                    capacity = max(end, len(text) * _SAMPLES_PER_CHAR_ESTIMATE)
+                    if buffer is not None:
+                        capacity = max(capacity, 2 * buffer.size)
+                    grown = np.empty(capacity, dtype=np.float32)
+                    if buffer is not None:
+                        grown[:total] = buffer[:total]
+                    buffer = grown
+                buffer[total:end] = audio_data
+                total = end
+
+            if not total:
                 return {"error": "No audio"}
 
-            # Concatenate all segments
-            if len(segments) == 1:
-                audio = segments[0]
-            else:
-                audio = np.concatenate(segments, axis=0)
+            audio = buffer[:total]
 
             print(
                 f"Final audio shape: {audio.shape}, min: {audio.min():.4f}, max: {audio.max():.4f}",
@@ -119,32 +142,45 @@ class Worker:
                 return {"error": "Generated audio is silent"}
 
             # Convert to 16-bit PCM
-            audio_int16 = (audio * 32767).astype(np.int16)
-            audio_b64 = base64.b64encode(audio_int16.tobytes()).decode()
-
-            return {"success": True, "audio": audio_b64}
+            return (audio * 32767).astype(np.int16).tobytes()
         except Exception as e:
-            import traceback
-
-            return {"error": f"{str(e)}\n{traceback.format_exc()}"}
+            return error_response(e)
+        finally:
+            if (
+                MLX_AVAILABLE
+                and hasattr(mx, "clear_cache")
+                and time.monotonic() - started >= _CLEAR_CACHE_AFTER_SECONDS
+            ):
+                mx.clear_cache()
 
 
 def main():
     """Main worker loop - reads commands from stdin, writes responses to stdout."""
+    frames = open_frame_stream()
     worker = Worker()
 
-    for line in sys.stdin:
+    for line in sys.stdin.buffer:
         try:
-            req = json.loads(line.strip())
+            req = loads(line)
+            if req["cmd"] == "cancel":
+                # Marvis answers in one frame, so there is never anything to stop.
+                continue
             if req["cmd"] == "init":
                 resp = worker.initialize(req["model"], req["voice"])
             elif req["cmd"] == "generate":
                 resp = worker.generate(req["text"])
+                if isinstance(resp, bytes):
+                    write_pcm(frames, resp, flush=False)
+                    resp = {"success": True, "final": True}
+            elif req["cmd"] == "warmup":
+                resp = worker.generate(req.get("text") or "Hello")
+                if isinstance(resp, bytes):
+                    resp = {"success": True, "final": True}
             else:
                 resp = {"error": "Unknown command"}
-            print(json.dumps(resp), flush=True)
+            write_json(frames, resp)
         except Exception as e:
-            print(json.dumps({"error": str(e)}), flush=True)
+            write_json(frames, error_response(e))
 
 
 if __name__ == "__main__":
@@ -3,41 +3,178 @@
 Standalone Qwen3 TTS worker process.
 
 This worker runs in complete isolation to avoid Metal threading conflicts.
-It communicates via JSON over stdin/stdout.
+It reads JSON commands on stdin and answers with binary frames on stdout.
 
 Commands:
     {"cmd": "init", "model": "...", "mode": "base", "language": "English", "speaker": "Ryan"}
     {"cmd": "configure", "mode": "...", "language": "...", "speaker": "...", "instruct": "...", "refAudioPath": "...", "refText": "..."}
     {"cmd": "generate", "text": "...", "mode": "...", "language": "...", "speaker": "...", "instruct": "...", "refAudioPath": "...", "refText": "..."}
+    {"cmd": "warmup", ...same fields as generate...}   # only the final frame is sent
+
+Responses are framed on stdout (see tts_ipc.py): "generate" sends PCM frames
+as segments are synthesized (very short ones are coalesced) and ends with a
+{"success": true, "final": true} JSON frame (or a single {"error": ...}).
 """
 
-import sys
-import json
-import base64
 import numpy as np
 import random
 import inspect
 import os
+import time
 import urllib.parse
 import urllib.request
 
+from tts_buffers import BufferPool, to_pcm, warm_pcm_packer
+from tts_ipc import CommandReader, error_response, loads, open_frame_stream, write_json, write_responses
+
 import logging
 
 logging.basicConfig(level=logging.INFO, format="WORKER: %(message)s")
 
-try:
-    import mlx.core as mx
-    from mlx_audio.tts.utils import load_model
+# MLX and mlx-audio are imported by _ensure_mlx() on the first init, so
+# starting the worker doesn't pay for loading Metal and the model stack.
+mx = None
+load_model = None
+load_audio = None
+MLX_AVAILABLE = None
+
+
+def _ensure_mlx():
+    """Import MLX and mlx-audio once; returns whether they are available."""
+    global mx, load_model, load_audio, MLX_AVAILABLE
+    if MLX_AVAILABLE is None:
+        try:
+            import mlx.core as mx
+            from mlx_audio.tts.utils import load_model
+
+            MLX_AVAILABLE = True
+        except ImportError:
+            MLX_AVAILABLE = False
+            return MLX_AVAILABLE
+        try:
+            from mlx_audio.tts.generate import load_audio
+        except ImportError:  # the model then decodes the reference path on every call
+            load_audio = None
+    return MLX_AVAILABLE
+
+
+# Segments between mx.clear_cache() calls while streaming a generate.
+_CLEAR_CACHE_EVERY = 25
 
-    MLX_AVAILABLE = True
-except ImportError:
-    mx = None
-    MLX_AVAILABLE = False
+# Generates that ran at least this long (seconds) release MLX's buffer cache
+# when they end, so peak working sets don't ratchet up the worker's memory;
+# shorter ones keep it warm for the next.
+_CLEAR_CACHE_AFTER_SECONDS = 0.2
+
+# Loaded models by name as (model, speakers, languages, has_encoder), so a
+# repeated init only re-binds the voice settings.
+_MODEL_CACHE = {}
+
+
+def _load_qwen_model(model_name, with_encoder):
+    kwargs = {}
+    if not with_encoder:
+        try:
+            if "load_encoder" in inspect.signature(load_model).parameters:
+                kwargs["load_encoder"] = False
+        except (TypeError, ValueError):
+            pass
+    model = load_model(model_name, **kwargs)
+    cached = (
+        model,
+        model.get_supported_speakers()
+        if hasattr(model, "get_supported_speakers")
+        else None,
+        model.get_supported_languages()
+        if hasattr(model, "get_supported_languages")
+        else None,
+        not kwargs,
+    )
+    _MODEL_CACHE[model_name] = cached
+    return cached
+
+
+# Settings each mode passes to the model, and the method that takes them.
+_SAMPLING_FIELDS = (
+    "temperature",
+    "top_k",
+    "top_p",
+    "repetition_penalty",
+    "max_tokens",
+    "do_sample",
+    "speed",
+)
+_MODE_FIELDS = {
+    "customVoice": (
+        "generate_custom_voice",
+        ("text", "instruct", "speaker", "language") + _SAMPLING_FIELDS,
+    ),
+    "voiceDesign": (
+        "generate_voice_design",
+        ("text", "instruct", "language") + _SAMPLING_FIELDS,
+    ),
+    "voiceCloning": (
+        "generate",
+        ("text", "ref_audio", "ref_text", "language")
+        + _SAMPLING_FIELDS
+        + ("x_vector_only_mode", "stt_model"),
+    ),
+    "base": ("generate", ("text", "speaker", "language") + _SAMPLING_FIELDS),
+}
+# Keyword names a setting may go under, in order of preference.
+_KWARG_CANDIDATES = {
+    "speaker": ("speaker", "voice"),
+    "language": ("lang_code", "language"),
+    "ref_audio": ("ref_audio", "ref_audio_path"),
+    "ref_text": ("ref_text", "prompt_text"),
+    "max_tokens": ("max_tokens", "max_new_tokens"),
+}
+
+
+def _mode_kwarg_default(mode, field, candidates):
+    """Keyword used for `field` when the method only takes **kwargs."""
+    if field == "speaker":
+        return "speaker" if mode == "customVoice" else "voice"
+    if field == "language":
+        return "language" if mode in ("customVoice", "voiceDesign") else "lang_code"
+    if field == "max_tokens":
+        return "max_new_tokens"
+    return candidates[0]
+
+
+_LANGUAGE_ALIASES = {
+    "en": "english",
+    "english": "english",
+    "pt": "portuguese",
+    "pt-br": "portuguese",
+    "pt_br": "portuguese",
+    "ptbr": "portuguese",
+    "portuguese (brazil)": "portuguese",
+    "portuguese": "portuguese",
+    "chinese": "chinese",
+    "zh": "chinese",
+    "japanese": "japanese",
+    "ja": "japanese",
+    "korean": "korean",
+    "ko": "korean",
+    "french": "french",
+    "fr": "french",
+    "german": "german",
+    "de": "german",
+    "italian": "italian",
+    "it": "italian",
+    "spanish": "spanish",
+    "es": "spanish",
+    "russian": "russian",
+    "ru": "russian",
+    "auto": "auto",
+}
 
 
 class Worker:
     def __init__(self):
         self.model = None
+        self.model_name = None
         self.mode = "base"
         self.language = "english"
         self.speaker = "Ryan"
@@ -52,6 +189,12 @@ class Worker:
         self.x_vector_only_mode = None
         self.supported_speakers = None
         self.supported_languages = None
+        self._supported_speakers_lower = {}
+        self._supported_languages_lower = frozenset()
+        self._signature_cache = {}
+        self._generate_plans = {}
+        self._ref_audio_cache = None
+        self._pool = BufferPool()
 
     def initialize(
         self,
@@ -66,10 +209,20 @@ class Worker:
         stt_model=None,
         x_vector_only_mode=None,
     ):
-        if not MLX_AVAILABLE:
+        if not _ensure_mlx():
             return {"error": "MLX not available"}
         try:
-            self.model = load_model(model_name)
+            # Only voice cloning needs the speech-tokenizer encoder; the other
+            # modes can skip it when this mlx-audio version allows.
+            with_encoder = (mode or self.mode) == "voiceCloning"
+            cached = _MODEL_CACHE.get(model_name)
+            if cached is None or (with_encoder and not cached[3]):
+                cached = _load_qwen_model(model_name, with_encoder)
+            self.model, self.supported_speakers, self.supported_languages, _ = cached
+            self._generate_plans = {}
+            self._ref_audio_cache = None
+            warm_pcm_packer()
+            self.model_name = model_name
             if mode:
                 self.mode = mode
             if language:
@@ -88,15 +241,11 @@ class Worker:
                 self.stt_model = stt_model
             if x_vector_only_mode is not None:
                 self.x_vector_only_mode = x_vector_only_mode
-            self.supported_speakers = (
-                self.model.get_supported_speakers()
-                if hasattr(self.model, "get_supported_speakers")
-                else None
-            )
-            self.supported_languages = (
-                self.model.get_supported_languages()
-                if hasattr(self.model, "get_supported_languages")
-                else None
+            self._supported_speakers_lower = {
+                s.casefold(): s for s in self.supported_speakers or ()
+            }
+            self._supported_languages_lower = frozenset(
+                lang.casefold() for lang in self.supported_languages or ()
             )
             return {"success": True}
         except Exception as e:
@@ -215,41 +364,43 @@ class Worker:
             except Exception:
                 pass
 
+    def _ensure_encoder(self):
+        """Load the encoder skipped at init once voice cloning is requested."""
+        cached = _MODEL_CACHE.get(self.model_name)
+        if cached is None or cached[3]:
+            return
+        if hasattr(self.model, "load_encoder"):
+            self.model.load_encoder()
+            _MODEL_CACHE[self.model_name] = (*cached[:3], True)
+        else:
+            cached = _load_qwen_model(self.model_name, True)
+            self.model = cached[0]
+
+    def _reference_audio(self, path):
+        """Decoded reference audio for `path`, reused while the file is unchanged.
+
+        Falls back to the path itself (decoded by the model on every call)
+        when this mlx-audio build has no loader or the decode fails.
+        """
+        sample_rate = getattr(self.model, "sample_rate", None)
+        if load_audio is None or not sample_rate:
+            return path
+        try:
+            key = (path, os.path.getmtime(path), sample_rate)
+            if self._ref_audio_cache is None or self._ref_audio_cache[0] != key:
+                self._ref_audio_cache = (key, load_audio(path, sample_rate=sample_rate))
+            return self._ref_audio_cache[1]
+        except Exception as e:
+            logging.info(f"Could not pre-decode reference audio ({e}); passing the path.")
+            return path
+
     def _normalize_language(self, value):
         if not value:
             return "auto"
-        raw = str(value).strip().lower()
-        aliases = {
-            "en": "english",
-            "english": "english",
-            "pt": "portuguese",
-            "pt-br": "portuguese",
-            "pt_br": "portuguese",
-            "ptbr": "portuguese",
-            "portuguese (brazil)": "portuguese",
-            "portuguese": "portuguese",
-            "chinese": "chinese",
-            "zh": "chinese",
-            "japanese": "japanese",
-            "ja": "japanese",
-            "korean": "korean",
-            "ko": "korean",
-            "french": "french",
-            "fr": "french",
-            "german": "german",
-            "de": "german",
-            "italian": "italian",
-            "it": "italian",
-            "spanish": "spanish",
-            "es": "spanish",
-            "russian": "russian",
-            "ru": "russian",
-            "auto": "auto",
-        }
-        normalized = aliases.get(raw, raw)
+        raw = str(value).strip().casefold()
+        normalized = _LANGUAGE_ALIASES.get(raw, raw)
         if self.supported_languages:
-            supported = {lang.lower() for lang in self.supported_languages}
-            if normalized not in supported and normalized != "auto":
+            if normalized not in self._supported_languages_lower and normalized != "auto":
                 logging.info(
                     f"Unsupported language '{value}'. Using auto. Supported: {self.supported_languages}"
                 )
@@ -266,16 +417,15 @@ class Worker:
                 "Model does not expose predefined speakers. Ignoring speaker selection."
             )
             return None
-        normalized = str(speaker)
-        supported_lower = {s.lower(): s for s in self.supported_speakers}
-        if normalized.lower() not in supported_lower:
+        normalized = str(speaker).casefold()
+        if normalized not in self._supported_speakers_lower:
             if mode == "customVoice":
                 return "INVALID"
             logging.info(
                 f"Speaker '{speaker}' not supported. Available: {self.supported_speakers}"
             )
             return None
-        return supported_lower[normalized.lower()]
+        return self._supported_speakers_lower[normalized]
 
     def _resolve_sampling(self, temperature, top_k, top_p, repetition_penalty):
         temp = 0.9 if temperature is None else float(temperature)
@@ -337,87 +487,66 @@ class Worker:
         return raw
 
     def _signature_info(self, func):
+        # Model methods don't change after init, so inspect each one only once.
+        key = getattr(func, "__func__", func)
+        info = self._signature_cache.get(key)
+        if info is not None:
+            return info
         try:
             sig = inspect.signature(func)
         except (TypeError, ValueError):
-            return set(), True
-        params = sig.parameters
-        accepts_kwargs = any(
-            param.kind == inspect.Parameter.VAR_KEYWORD for param in params.values()
-        )
-        return set(params.keys()), accepts_kwargs
-
-    def _filter_kwargs(self, params, accepts_kwargs, kwargs):
-        cleaned = {key: value for key, value in kwargs.items() if value is not None}
-        if accepts_kwargs:
-            return cleaned
-        return {key: value for key, value in cleaned.items() if key in params}
-
-    def _add_language_kw(self, params, accepts_kwargs, kwargs, language, default_key):
-        if language is None:
-            return
-        if "lang_code" in params:
-            kwargs["lang_code"] = language
-        elif "language" in params:
-            kwargs["language"] = language
-        elif accepts_kwargs:
-            kwargs[default_key] = language
-
-    def _add_speaker_kw(self, params, accepts_kwargs, kwargs, speaker, default_key):
-        if not speaker:
-            return
-        if "speaker" in params:
-            kwargs["speaker"] = speaker
-        elif "voice" in params:
-            kwargs["voice"] = speaker
-        elif accepts_kwargs:
-            kwargs[default_key] = speaker
-
-    def _add_ref_audio_kw(self, params, accepts_kwargs, kwargs, ref_audio):
-        if ref_audio is None:
-            return
-        if isinstance(ref_audio, (list, tuple, np.ndarray)) and len(ref_audio) == 0:
-            return
-        if "ref_audio" in params:
-            kwargs["ref_audio"] = ref_audio
-        elif "ref_audio_path" in params:
-            kwargs["ref_audio_path"] = ref_audio
-        elif accepts_kwargs:
-            kwargs["ref_audio"] = ref_audio
-
-    def _add_ref_text_kw(self, params, accepts_kwargs, kwargs, ref_text):
-        if not ref_text:
-            return
-        if "ref_text" in params:
-            kwargs["ref_text"] = ref_text
-        elif "prompt_text" in params:
-            kwargs["prompt_text"] = ref_text
-        elif accepts_kwargs:
-            kwargs["ref_text"] = ref_text
-
-    def _add_max_tokens_kw(self, params, accepts_kwargs, kwargs, max_tokens):
-        if max_tokens is None:
-            return
-        if "max_tokens" in params:
-            kwargs["max_tokens"] = max_tokens
-        elif "max_new_tokens" in params:
-            kwargs["max_new_tokens"] = max_tokens
-        elif accepts_kwargs:
-            kwargs["max_new_tokens"] = max_tokens
-
-    def _add_kw(self, params, accepts_kwargs, kwargs, key, value):
-        if value is None:
-            return
-        if key in params or accepts_kwargs:
-            kwargs[key] = value
+            info = (frozenset(), True)
+        else:
+            params = sig.parameters
+            accepts_kwargs = any(
+                param.kind == inspect.Parameter.VAR_KEYWORD for param in params.values()
+            )
+            info = (frozenset(params), accepts_kwargs)
+        self._signature_cache[key] = info
+        return info
+
+    def _generate_plan(self, mode):
+        """(method name, ((field, kwarg name), ...)) for generating in `mode`.
+
+        Which keyword each setting goes under depends only on the loaded
+        model's method signature, so it is resolved once per mode.
+        """
+        plan = self._generate_plans.get(mode)
+        if plan is not None:
+            return plan
+        method_name, fields = _MODE_FIELDS.get(mode, _MODE_FIELDS["base"])
+        params, accepts_kwargs = self._signature_info(getattr(self.model, method_name))
+        resolved = []
+        for field in fields:
+            candidates = _KWARG_CANDIDATES.get(field, (field,))
+            default = _mode_kwarg_default(mode, field, candidates)
+            name = next((c for c in candidates if c in params), None)
+            if name is None and accepts_kwargs:
+                name = default
+            if name is not None:
+                resolved.append((field, name))
+        plan = (method_name, tuple(resolved))
+        self._generate_plans[mode] = plan
+        return plan
+
+    def warmup(self, req: dict):
+        """Run a generate for `req` and discard the audio, compiling kernels up front."""
+        for resp in self.generate(req):
+            if isinstance(resp, dict):
+                return resp
+        return {"error": "No audio"}
 
     def generate(self, req: dict):
+        """Yield one response per synthesized segment, then a final marker."""
+        started = time.monotonic()
         try:
             if not self.model:
-                return {"error": "Not initialized"}
+                yield {"error": "Not initialized"}
+                return
             text = req.get("text", "")
             if not text:
-                return {"error": "Missing text"}
+                yield {"error": "Missing text"}
+                return
             (
                 mode,
                 language,
@@ -443,12 +572,13 @@ class Worker:
                 speaker = None
             speaker = self._normalize_speaker(speaker, mode)
             if speaker == "INVALID":
-                return {
+                yield {
                     "error": (
                         f"Speaker '{req.get('speaker')}' not supported. "
                         f"Available: {self.supported_speakers}"
                     )
                 }
+                return
             (
                 temperature,
                 top_k,
@@ -462,164 +592,126 @@ class Worker:
             stt_model = stt_model if isinstance(stt_model, str) and stt_model.strip() else None
 
             if mode == "voiceCloning":
+                self._ensure_encoder()
                 if not ref_audio_path:
-                    return {"error": "Voice cloning requires a reference audio path."}
+                    yield {"error": "Voice cloning requires a reference audio path."}
+                    return
                 if not os.path.isfile(ref_audio_path):
-                    return {"error": f"Reference audio file not found: {ref_audio_path}"}
+                    yield {"error": f"Reference audio file not found: {ref_audio_path}"}
+                    return
                 if not ref_text:
                     logging.info(
                         "Voice cloning without reference transcript; using speaker embedding only."
                     )
 
-            if mode == "customVoice":
-                params, accepts_kwargs = self._signature_info(
-                    self.model.generate_custom_voice
-                )
-                kwargs = {"text": text, "instruct": instruct}
-                self._add_speaker_kw(params, accepts_kwargs, kwargs, speaker, "speaker")
-                self._add_language_kw(
-                    params, accepts_kwargs, kwargs, language, "language"
-                )
-                self._add_kw(params, accepts_kwargs, kwargs, "temperature", temperature)
-                self._add_kw(params, accepts_kwargs, kwargs, "top_k", top_k)
-                self._add_kw(params, accepts_kwargs, kwargs, "top_p", top_p)
-                self._add_kw(
-                    params,
-                    accepts_kwargs,
-                    kwargs,
-                    "repetition_penalty",
-                    repetition_penalty,
-                )
-                self._add_max_tokens_kw(params, accepts_kwargs, kwargs, max_tokens)
-                self._add_kw(params, accepts_kwargs, kwargs, "do_sample", do_sample)
-                self._add_kw(params, accepts_kwargs, kwargs, "speed", speed)
-                iterator = self.model.generate_custom_voice(
-                    **self._filter_kwargs(params, accepts_kwargs, kwargs)
-                )
-            elif mode == "voiceDesign":
-                params, accepts_kwargs = self._signature_info(
-                    self.model.generate_voice_design
-                )
-                kwargs = {"text": text, "instruct": instruct}
-                self._add_language_kw(
-                    params, accepts_kwargs, kwargs, language, "language"
-                )
-                self._add_kw(params, accepts_kwargs, kwargs, "temperature", temperature)
-                self._add_kw(params, accepts_kwargs, kwargs, "top_k", top_k)
-                self._add_kw(params, accepts_kwargs, kwargs, "top_p", top_p)
-                self._add_kw(
-                    params,
-                    accepts_kwargs,
-                    kwargs,
-                    "repetition_penalty",
-                    repetition_penalty,
-                )
-                self._add_max_tokens_kw(params, accepts_kwargs, kwargs, max_tokens)
-                self._add_kw(params, accepts_kwargs, kwargs, "do_sample", do_sample)
-                self._add_kw(params, accepts_kwargs, kwargs, "speed", speed)
-                iterator = self.model.generate_voice_design(
-                    **self._filter_kwargs(params, accepts_kwargs, kwargs)
-                )
-            elif mode == "voiceCloning":
-                ref_audio = ref_audio_path if ref_audio_path else None
-                params, accepts_kwargs = self._signature_info(self.model.generate)
-                if (
-                    "ref_audio" not in params
-                    and "ref_audio_path" not in params
-                    and not accepts_kwargs
-                ):
-                    return {
-                        "error": (
-                            "This mlx-audio build does not accept reference audio for "
-                            "voice cloning. Update mlx-audio to a newer version."
-                        )
-                    }
-                kwargs = {"text": text}
-                if ref_audio and "ref_audio" in params and "ref_audio_path" not in params:
-                    # Pass the path string; mlx-audio will load the file internally.
-                    ref_audio = str(ref_audio)
-                self._add_ref_audio_kw(params, accepts_kwargs, kwargs, ref_audio)
-                self._add_ref_text_kw(params, accepts_kwargs, kwargs, ref_text)
-                self._add_language_kw(
-                    params, accepts_kwargs, kwargs, language, "lang_code"
-                )
-                self._add_kw(params, accepts_kwargs, kwargs, "temperature", temperature)
-                self._add_kw(params, accepts_kwargs, kwargs, "top_k", top_k)
-                self._add_kw(params, accepts_kwargs, kwargs, "top_p", top_p)
-                self._add_kw(
-                    params,
-                    accepts_kwargs,
-                    kwargs,
-                    "repetition_penalty",
-                    repetition_penalty,
-                )
-                self._add_max_tokens_kw(params, accepts_kwargs, kwargs, max_tokens)
-                self._add_kw(params, accepts_kwargs, kwargs, "do_sample", do_sample)
-                self._add_kw(params, accepts_kwargs, kwargs, "speed", speed)
-                self._add_kw(
-                    params,
-                    accepts_kwargs,
-                    kwargs,
-                    "x_vector_only_mode",
-                    x_vector_only_mode,
-                )
-                self._add_kw(params, accepts_kwargs, kwargs, "stt_model", stt_model)
-                iterator = self.model.generate(
-                    **self._filter_kwargs(params, accepts_kwargs, kwargs)
-                )
-            else:
-                params, accepts_kwargs = self._signature_info(self.model.generate)
-                kwargs = {"text": text}
-                self._add_speaker_kw(params, accepts_kwargs, kwargs, speaker, "voice")
-                self._add_language_kw(
-                    params, accepts_kwargs, kwargs, language, "lang_code"
-                )
-                self._add_kw(params, accepts_kwargs, kwargs, "temperature", temperature)
-                self._add_kw(params, accepts_kwargs, kwargs, "top_k", top_k)
-                self._add_kw(params, accepts_kwargs, kwargs, "top_p", top_p)
-                self._add_kw(
-                    params,
-                    accepts_kwargs,
-                    kwargs,
-                    "repetition_penalty",
-                    repetition_penalty,
-                )
-                self._add_max_tokens_kw(params, accepts_kwargs, kwargs, max_tokens)
-                self._add_kw(params, accepts_kwargs, kwargs, "do_sample", do_sample)
-                self._add_kw(params, accepts_kwargs, kwargs, "speed", speed)
-                iterator = self.model.generate(
-                    **self._filter_kwargs(params, accepts_kwargs, kwargs)
-                )
-
-            segments = []
-            for result in iterator:
-                audio_data = np.array(result.audio, copy=True)
-                segments.append(audio_data)
-
-            if not segments:
-                return {"error": "No audio"}
-
-            audio = segments[0] if len(segments) == 1 else np.concatenate(segments, axis=0)
-
-            if np.max(np.abs(audio)) < 1e-6:
-                return {"error": "Generated audio is silent"}
+            method_name, plan = self._generate_plan(mode)
+            ref_audio_kwarg = dict(plan).get("ref_audio")
+            if mode == "voiceCloning" and ref_audio_kwarg is None:
+                yield {
+                    "error": (
+                        "This mlx-audio build does not accept reference audio for "
+                        "voice cloning. Update mlx-audio to a newer version."
+                    )
+                }
+                return
+            ref_audio = ref_audio_path or None
+            if ref_audio and ref_audio_kwarg == "ref_audio":
+                # Only the array-accepting keyword takes pre-decoded audio.
+                ref_audio = self._reference_audio(ref_audio)
+            values = {
+                "text": text,
+                "instruct": instruct,
+                "speaker": speaker or None,
+                "language": language,
+                "ref_audio": ref_audio,
+                "ref_text": ref_text or None,
+                "temperature": temperature,
+                "top_k": top_k,
+                "top_p": top_p,
+                "repetition_penalty": repetition_penalty,
+                "max_tokens": max_tokens,
+                "do_sample": do_sample,
+                "speed": speed,
+                "x_vector_only_mode": x_vector_only_mode,
+                "stt_model": stt_model,
+            }
+            iterator = getattr(self.model, method_name)(
+                **{
+                    name: values[field]
+                    for field, name in plan
+                    if values[field] is not None
+                }
+            )
 
-            audio_int16 = (audio * 32767).astype(np.int16)
-            audio_b64 = base64.b64encode(audio_int16.tobytes()).decode()
-            return {"success": True, "audio": audio_b64}
+            # Stream each segment as it is produced; leading silent segments
+            # are held back so an all-silent result is still a single error.
+            produced = False
+            held_silence = []
+            for index, result in enumerate(iterator):
+                # Evaluate each segment as it arrives so the lazy graph stays
+                # shallow, and release cached Metal buffers periodically.
+                if isinstance(result.audio, mx.array):
+                    mx.eval(result.audio)
+                if (index + 1) % _CLEAR_CACHE_EVERY == 0 and hasattr(mx, "clear_cache"):
+                    mx.clear_cache()
+                audio_data = _as_numpy(result.audio)
+                if audio_data.size == 0:
+                    continue
+                produced = True
+                pcm, peak = to_pcm(audio_data, self._pool)
+                if held_silence is not None:
+                    if peak < 1e-6:
+                        held_silence.append(pcm)
+                        continue
+                    yield from held_silence
+                    held_silence = None
+                yield pcm
+
+            if not produced:
+                yield {"error": "No audio"}
+            elif held_silence is not None:
+                yield {"error": "Generated audio is silent"}
+            else:
+                yield {"success": True, "final": True}
         except Exception as e:
-            import traceback
+            yield error_response(e)
+        finally:
+            if (
+                MLX_AVAILABLE
+                and hasattr(mx, "clear_cache")
+                and time.monotonic() - started >= _CLEAR_CACHE_AFTER_SECONDS
+            ):
+                mx.clear_cache()
 
-            return {"error": f"{str(e)}\n{traceback.format_exc()}"}
+
+def _as_numpy(audio):
+    """Flat numpy view of an evaluated MLX segment, copying only as a fallback."""
+    try:
+        return np.asarray(memoryview(audio)).reshape(-1)
+    except (TypeError, ValueError, BufferError):
+        return np.array(audio, copy=True).reshape(-1)
 
 
 def main():
+    frames = open_frame_stream()
     worker = Worker()
+    preload = os.environ.get("IARA_PRELOAD_MODEL")
+    if preload:
+        # Load and warm before the parent's first command arrives.
+        status = worker.initialize(preload, mode=os.environ.get("IARA_PRELOAD_MODE"))
+        if status.get("success"):
+            status = worker.warmup({"text": "Hello"})
+        logging.info(f"Preloaded {preload}: {status}")
+
+    commands = CommandReader()
 
-    for line in sys.stdin:
+    for line in commands:
         try:
-            req = json.loads(line.strip())
+            req = loads(line)
             cmd = req.get("cmd")
+            if cmd == "cancel":
+                # Arrived after its generate finished; nothing to stop.
+                continue
             if cmd == "init":
                 resp = worker.initialize(
                     req["model"],
@@ -636,12 +728,15 @@ def main():
             elif cmd == "configure":
                 resp = worker.configure(req)
             elif cmd == "generate":
-                resp = worker.generate(req)
+                write_responses(frames, worker.generate(req), commands)
+                continue
+            elif cmd == "warmup":
+                resp = worker.warmup(req)
             else:
                 resp = {"error": "Unknown command"}
-            print(json.dumps(resp), flush=True)
+            write_json(frames, resp)
         except Exception as e:
-            print(json.dumps({"error": str(e)}), flush=True)
+            write_json(frames, error_response(e))
 
 
 if __name__ == "__main__":
@@ -2,11 +2,19 @@
 Runtime compatibility shims loaded automatically by Python.
 
 This patches phonemizer's EspeakWrapper for versions that don't expose
-set_data_path (required by misaki/espeak).
+set_data_path (required by misaki/espeak), and transformers' PreTrainedModel
+for code expecting all_tied_weights_keys (transformers>=5).
+
+The patches are applied when the patched module is first imported rather than
+here, so processes that never use phonemizer or transformers don't pay for
+importing them at startup.
 """
 
-try:
-    from phonemizer.backend.espeak.wrapper import EspeakWrapper
+import sys
+
+
+def _patch_espeak_wrapper(module):
+    EspeakWrapper = module.EspeakWrapper
 
     if not hasattr(EspeakWrapper, "set_data_path"):
         # Newer phonemizer exposes data_path property but not setter.
@@ -16,12 +24,10 @@ try:
             cls.data_path = path
 
         EspeakWrapper.set_data_path = set_data_path
-except Exception:
-    # If phonemizer isn't installed, do nothing.
-    pass
 
-try:
-    from transformers.modeling_utils import PreTrainedModel
+
+def _patch_modeling_utils(module):
+    PreTrainedModel = module.PreTrainedModel
 
     if not hasattr(PreTrainedModel, "all_tied_weights_keys"):
         # transformers>=5 expects all_tied_weights_keys on PreTrainedModel.
@@ -38,6 +44,50 @@ try:
             return {}
 
         PreTrainedModel.all_tied_weights_keys = all_tied_weights_keys
-except Exception:
-    # If transformers isn't installed, do nothing.
-    pass
+
+
+_PATCHES = {
+    "phonemizer.backend.espeak.wrapper": _patch_espeak_wrapper,
+    "transformers.modeling_utils": _patch_modeling_utils,
+}
+
+
+def _apply(name, module):
+    try:
+        _PATCHES[name](module)
+    except Exception:
+        # A layout we don't recognize; leave the module as is.
+        pass
+
+
+class _PatchOnImport:
+    """Meta path finder that runs a module's patch right after it executes."""
+
+    def find_spec(self, name, path, target=None):
+        if name not in _PATCHES:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if loader is None or not hasattr(loader, "exec_module"):
+            return spec
+        exec_module = loader.exec_module
+
+        def exec_and_patch(module):
+            exec_module(module)
+            _apply(name, module)
+
+        loader.exec_module = exec_and_patch
+        return spec
+
+
+for _name, _module in list(sys.modules.items()):
+    if _name in _PATCHES:
+        _apply(_name, _module)
+sys.meta_path.insert(0, _PatchOnImport())
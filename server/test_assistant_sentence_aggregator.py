@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("pipecat")
+
+from assistant_sentence_aggregator import (  # noqa: E402
+    SENTENCE_END_PATTERN,
+    SENTENCE_TAIL_CHARS,
+    TERMINATOR_CHAR_PATTERN,
+)
+
+
+def split_sentences(text: str) -> list:
+    sentences = []
+    start = 0
+    while True:
+        match = SENTENCE_END_PATTERN.search(text, start)
+        if not match:
+            break
+        sentences.append(text[start : match.end()].strip())
+        start = match.end()
+    return sentences
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Can I? Yes, you can. ", ["Can I?", "Yes, you can."]),
+        ("Wow!! Really?! Yes. ", ["Wow!!", "Really?!", "Yes."]),
+        ("Plan B. Then go. ", ["Plan B.", "Then go."]),
+        ("you and I. Then we left. ", ["you and I.", "Then we left."]),
+        ("J. R. R. Tolkien wrote it. Yes ", ["J. R. R. Tolkien wrote it."]),
+        ("Dr. Smith is here. Mr. Jones too. ", ["Dr. Smith is here.", "Mr. Jones too."]),
+        ("Use e.g. this one. Next ", ["Use e.g. this one."]),
+        ("The U.S.A. is big. ok ", ["The U.S.A. is big."]),
+        ("O Sr. Silva chegou. Depois saiu. ", ["O Sr. Silva chegou.", "Depois saiu."]),
+        ("A Sra. Lima e a Dra. Souza. ok ", ["A Sra. Lima e a Dra. Souza."]),
+        ("Fale com a Profa. Ana. ok ", ["Fale com a Profa. Ana."]),
+        ('He said "stop." Then left. ', ['He said "stop."', "Then left."]),
+        ("你好。再见！", ["你好。", "再见！"]),
+    ],
+)
+def test_sentence_ends(text, expected):
+    assert split_sentences(text) == expected
+
+
+@pytest.mark.parametrize("partial", ["J. R", "Plan B. T"])
+def test_lone_capital_waits_for_next_word(partial):
+    assert SENTENCE_END_PATTERN.search(partial) is None
+
+
+def test_gate_matches_pattern_terminators():
+    # ":" and ";" never end a sentence, so they must not trigger a scan.
+    assert TERMINATOR_CHAR_PATTERN.search("note: this; that") is None
+    assert not {":", ";", "：", "；"} & SENTENCE_TAIL_CHARS
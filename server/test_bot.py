@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+pytest.importorskip("pipecat")
+pytest.importorskip("fastapi")
+
+import bot  # noqa: E402
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "voice-ui-config.json"
+    monkeypatch.setenv("VOICE_UI_CONFIG_PATH", str(path))
+    monkeypatch.setattr(bot, "_CONFIG_CACHE", None)
+    bot._config_path.cache_clear()
+    yield path
+    bot._config_path.cache_clear()
+
+
+def write_preset(path, values):
+    path.write_text(
+        json.dumps({"activePresetId": "p", "presets": [{"id": "p", "values": values}]})
+    )
+
+
+def test_warmup_signature_ignores_unvalidated_qwen_tts(config_file):
+    write_preset(
+        config_file,
+        {"ttsModel": "mlx-community/Kokoro-82M-bf16", "qwenTts": {"instruct": ["calm"]}},
+    )
+    config = bot._load_active_config()
+    hash(config["_warmupSignature"])
+    assert config["_warmupSignature"][-1] == ()
+
+
+def test_warmup_signature_for_qwen_is_hashable(config_file):
+    write_preset(
+        config_file,
+        {
+            "ttsModel": "mlx-community/Qwen3-TTS-12Hz-0.6B-Base-bf16",
+            "ttsVoice": ["unused"],
+            "qwenTts": {"instruct": ["calm"], "seed": 7},
+        },
+    )
+    config = bot._load_active_config()
+    hash(config["_warmupSignature"])
+    qwen_signature = dict(config["_warmupSignature"][-1])
+    assert qwen_signature["instruct"] == ""
+    assert qwen_signature["seed"] == 7
@@ -0,0 +1,98 @@
+"""
+Scratch-array reuse for the TTS workers.
+
+Each generated segment needs scratch space to become an int16 PCM frame. The
+buffers are short-lived and similarly sized from one utterance to the next, so
+they are recycled instead of reallocated.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional; to_pcm falls back to numpy
+    njit = None
+
+# Free arrays kept per (dtype, bucket); anything beyond this is left to the GC.
+MAX_FREE_PER_BUCKET = 4
+
+
+class BufferPool:
+    """Hands out 1-D numpy arrays in power-of-two size buckets.
+
+    Not thread-safe: each worker process generates on a single thread.
+    """
+
+    def __init__(self):
+        self._free = {}
+
+    def acquire(self, n: int, dtype) -> np.ndarray:
+        """Return an uninitialized array of length `n` (a view on a pooled bucket)."""
+        dtype = np.dtype(dtype)
+        bucket = 1 << max(n - 1, 0).bit_length()
+        free = self._free.get((dtype, bucket))
+        arr = free.pop() if free else np.empty(bucket, dtype)
+        return arr[:n]
+
+    def release(self, arr: np.ndarray) -> None:
+        """Give back an array obtained from `acquire`."""
+        base = arr.base if arr.base is not None else arr
+        free = self._free.setdefault((base.dtype, base.size), [])
+        if len(free) < MAX_FREE_PER_BUCKET:
+            free.append(base)
+
+
+if njit is not None:
+
+    @njit(fastmath=True, cache=True)
+    def _pack_i16(src, dst):
+        # Peak, scale, clip and cast in one pass over the segment.
+        peak = 0.0
+        for i in range(src.size):
+            x = src[i]
+            if abs(x) > peak:
+                peak = abs(x)
+            v = x * 32767.0
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            dst[i] = np.int16(v)
+        return peak
+
+else:
+    _pack_i16 = None
+
+
+def warm_pcm_packer() -> None:
+    """Compile the numba kernel up front so the first segment doesn't pay for it."""
+    if _pack_i16 is None:
+        return
+    # Numba specializes on writability; model output views are read-only.
+    src = np.zeros(1, dtype=np.float32)
+    _pack_i16(src, np.empty(1, dtype=np.int16))
+    src.flags.writeable = False
+    _pack_i16(src, np.empty(1, dtype=np.int16))
+
+
+def to_pcm(audio: np.ndarray, pool: BufferPool) -> tuple:
+    """Convert a float segment to 16-bit PCM through pooled scratch buffers.
+
+    Returns (pcm_bytes, peak) where peak is the segment's max absolute sample,
+    found in the same pass. Clipping saturates out-of-range samples instead of
+    letting them wrap into pops. `audio` may be a read-only view of the model
+    output and is left as is.
+    """
+    pcm = pool.acquire(audio.size, np.int16)
+    if _pack_i16 is not None and audio.dtype == np.float32:
+        peak = float(_pack_i16(audio, pcm))
+    else:
+        scratch = pool.acquire(audio.size, np.float32)
+        np.multiply(audio, 32767.0, out=scratch, casting="unsafe")
+        peak = max(float(scratch.max()), -float(scratch.min())) / 32767.0
+        np.clip(scratch, -32768, 32767, out=scratch)
+        np.copyto(pcm, scratch, casting="unsafe")
+        pool.release(scratch)
+    data = pcm.tobytes()
+    pool.release(pcm)
+    return data, peak
@@ -0,0 +1,186 @@
+"""
+Framing for the TTS worker pipe (worker stdout -> parent).
+
+Every frame is a 5-byte header, struct "<BI" (frame type, payload length),
+followed by the payload:
+
+    FRAME_JSON  UTF-8 JSON control response ({"success": ...} / {"error": ...}).
+                Always the last frame of a command.
+    FRAME_PCM   Raw mono int16 PCM at the worker's sample rate. Zero or more
+                of these precede the final JSON frame of a "generate".
+
+Commands still go parent -> worker as one JSON object per line on stdin. A
+{"cmd": "cancel"} line sent while a "generate" is streaming stops it early; the
+worker then ends the command with {"success": true, "final": true,
+"cancelled": true}. A cancel that arrives after the command finished is ignored
+and gets no response.
+"""
+
+import json
+import os
+import selectors
+import struct
+import sys
+import traceback
+from collections import deque
+
+try:
+    import orjson
+except ImportError:  # workers may run under an interpreter without it
+    orjson = None
+
+FRAME_JSON = 0x01
+FRAME_PCM = 0x02
+
+HEADER = struct.Struct("<BI")
+
+# Full tracebacks in worker error responses are opt-in; formatting them on
+# every failure is slow and bloats the frame under a fault loop.
+DEBUG = os.environ.get("IARA_WORKER_DEBUG") == "1"
+
+# PCM pieces below this (100 ms of 24 kHz int16 mono) are held back and sent
+# with the next piece rather than as a frame of their own.
+MIN_PCM_FRAME_BYTES = 4800
+
+# Large enough that a header and a typical segment's PCM leave the worker in a
+# single write() on flush, instead of one for the header and one for the body.
+FRAME_BUFFER_SIZE = 1 << 20
+
+
+def dumps(message: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message).encode()
+
+
+def loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def error_response(exc: BaseException) -> dict:
+    """Error response for `exc`, with a traceback only when DEBUG is set."""
+    if DEBUG:
+        return {"error": str(exc), "traceback": traceback.format_exc()}
+    return {"error": str(exc)}
+
+
+def open_frame_stream():
+    """Claim the real stdout for frames and send everything else to stderr.
+
+    Libraries loaded by the workers print to stdout; with a binary protocol a
+    stray line would corrupt the stream, so fd 1 is pointed at stderr.
+    """
+    out = os.fdopen(os.dup(1), "wb", buffering=FRAME_BUFFER_SIZE)
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return out
+
+
+def write_json(out, message: dict) -> None:
+    payload = dumps(message)
+    out.write(HEADER.pack(FRAME_JSON, len(payload)))
+    out.write(payload)
+    out.flush()
+
+
+def write_pcm(out, pcm: bytes, flush: bool = True) -> None:
+    """Write a PCM frame; pass flush=False when a JSON frame follows at once,
+    so both leave the worker in the same write()."""
+    out.write(HEADER.pack(FRAME_PCM, len(pcm)))
+    out.write(pcm)
+    if flush:
+        out.flush()
+
+
+def write_responses(out, responses, commands=None) -> None:
+    """Frame a command's responses: PCM bytes, then one final JSON dict.
+
+    PCM pieces shorter than MIN_PCM_FRAME_BYTES are coalesced with the next
+    ones. With a CommandReader, a pending cancel stops the responses between
+    frames.
+    """
+    pending = []
+    pending_size = 0
+    for resp in responses:
+        if not isinstance(resp, bytes):
+            if pending:
+                write_pcm(out, b"".join(pending), flush=False)
+            write_json(out, resp)
+            return
+        if commands is not None and commands.cancel_requested():
+            if hasattr(responses, "close"):
+                responses.close()
+            write_json(out, {"success": True, "final": True, "cancelled": True})
+            return
+        pending.append(resp)
+        pending_size += len(resp)
+        if pending_size < MIN_PCM_FRAME_BYTES:
+            continue
+        write_pcm(out, pending[0] if len(pending) == 1 else b"".join(pending))
+        pending.clear()
+        pending_size = 0
+    if pending:
+        write_pcm(out, b"".join(pending))
+
+
+def _is_cancel(line: bytes) -> bool:
+    try:
+        return loads(line).get("cmd") == "cancel"
+    except Exception:
+        return False
+
+
+class CommandReader:
+    """Command lines from stdin that can also be polled while a command runs.
+
+    Iterating blocks for the next line, like iterating sys.stdin.buffer;
+    cancel_requested() checks for a cancel without blocking.
+    """
+
+    def __init__(self, stream=None):
+        self._fd = (stream or sys.stdin.buffer).fileno()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._fd, selectors.EVENT_READ)
+        self._buffer = bytearray()
+        self._lines = deque()
+        self._eof = False
+
+    def _fill(self, timeout) -> None:
+        if self._eof or not self._selector.select(timeout):
+            return
+        data = os.read(self._fd, 65536)
+        if not data:
+            self._eof = True
+            if self._buffer:
+                self._lines.append(bytes(self._buffer))
+                self._buffer.clear()
+            return
+        self._buffer += data
+        start = 0
+        while True:
+            end = self._buffer.find(b"\n", start)
+            if end < 0:
+                break
+            self._lines.append(bytes(self._buffer[start:end + 1]))
+            start = end + 1
+        del self._buffer[:start]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        while not self._lines:
+            if self._eof:
+                raise StopIteration
+            self._fill(None)
+        return self._lines.popleft()
+
+    def cancel_requested(self) -> bool:
+        self._fill(0)
+        for index, line in enumerate(self._lines):
+            if _is_cancel(line):
+                del self._lines[index]
+                return True
+        return False
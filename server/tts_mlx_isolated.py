@@ -4,15 +4,15 @@
 #
 
 import asyncio
+import functools
 import subprocess
 import json
-import base64
 import sys
 import os
 import re
-import threading
 import time
-from typing import AsyncGenerator, Optional, List, Dict, Tuple, Any
+from collections import OrderedDict
+from typing import AsyncGenerator, Callable, Iterable, Iterator, Optional, List, Dict, Tuple, Any
 from pathlib import Path
 
 from loguru import logger
@@ -27,10 +27,56 @@ from pipecat.frames.frames import (
 from pipecat.services.tts_service import TTSService
 from pipecat.utils.tracing.service_decorators import traced_tts
 
+from tts_ipc import FRAME_PCM, HEADER, dumps, loads
+
+# A word that ends a sentence: closing punctuation, then optional closing
+# quotes/brackets.
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]['\")\]]*$")
+# Last characters of a word after which an over-long segment may be cut early.
+_CLAUSE_BREAK_CHARS = frozenset(";:\u2014-")
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_worker_script(model_name: str) -> str:
+    """Get the path to the standalone worker script for `model_name`."""
+    # Worker scripts live in the same directory as this file
+    current_dir = Path(__file__).parent
+    if model_name.startswith("Marvis-AI"):
+        worker_path = current_dir / "marvis_worker.py"
+    elif model_name.startswith("mlx-community/Qwen3-TTS-"):
+        worker_path = current_dir / "qwen3_worker.py"
+    else:
+        worker_path = current_dir / "kokoro_worker.py"
+
+    logger.info(f"Using worker script: {worker_path}")
+
+    if not worker_path.exists():
+        raise FileNotFoundError(
+            f"Worker script not found at {worker_path}. "
+            "Make sure worker script is in the same directory as tts_mlx_isolated.py"
+        )
+
+    return str(worker_path)
+
+
+class _GenerateCancelled(Exception):
+    """A streaming generate was stopped before it finished (interruption)."""
+
 
 class TTSMLXIsolated(TTSService):
     """Completely isolated Kokoro TTS using subprocess to avoid Metal issues."""
     _shared_state: Dict[Tuple[object, ...], Dict[str, Any]] = {}
+    # PCM of finished segments by (worker signature, generate payload), shared
+    # by all instances so repeated phrases skip the worker; least recently
+    # used entries are dropped once the total passes audio_cache_max_bytes.
+    _audio_cache: "OrderedDict[Tuple[object, ...], Tuple[bytes, ...]]" = OrderedDict()
+    _audio_cache_bytes = 0
+    # Segments being generated right now, by the same key, so a concurrent
+    # request for one waits for its audio instead of generating it again.
+    _audio_inflight: Dict[Tuple[object, ...], asyncio.Future] = {}
+    # How segment metadata is written to each frame class, worked out on the
+    # first frame of that class rather than probed for every frame.
+    _metadata_writers: Dict[type, Callable[[Frame, Dict[str, Any]], None]] = {}
 
     def __init__(
         self,
@@ -46,6 +92,7 @@ class TTSMLXIsolated(TTSService):
         sentence_min_words: int = 3,
         sentence_max_chars: int = 220,
         sentence_max_words: int = 40,
+        audio_cache_max_bytes: int = 32 * 1024 * 1024,
         **kwargs,
     ):
         """Initialize the isolated Kokoro TTS service."""
@@ -65,9 +112,20 @@ class TTSMLXIsolated(TTSService):
         self._sentence_max_chars = sentence_max_chars
         self._sentence_max_words = sentence_max_words
         self._interrupt_id = 0
+        # In-flight streaming generate commands and the callback that stops each.
+        self._streams: Dict[asyncio.Future, Callable[[], None]] = {}
+        self._audio_cache_max_bytes = audio_cache_max_bytes
 
         # Get path to worker script
-        self._worker_script = self._get_worker_script_path()
+        self._worker_script = _resolve_worker_script(model)
+        self._worker_python = self._get_worker_python()
+        self._worker_env = {
+            "PYTHONUNBUFFERED": "1",
+            "HF_HUB_DISABLE_PROGRESS_BARS": "1",
+            "TRANSFORMERS_VERBOSITY": "error",
+            "TOKENIZERS_PARALLELISM": "false",
+            **os.environ,
+        }
 
         self._settings = {
             "model": model,
@@ -108,167 +166,182 @@ class TTSMLXIsolated(TTSService):
     def _get_shared_state(self) -> Dict[str, Any]:
         state = self.__class__._shared_state.get(self._signature)
         if not state:
-            state = {"process": None, "initialized": False, "lock": threading.Lock()}
+            state = {"process": None, "initialized": False, "lock": asyncio.Lock()}
             self.__class__._shared_state[self._signature] = state
         return state
 
-    def _normalize_text(self, text: str) -> str:
-        return re.sub(r"\s+", " ", text).strip()
-
-    def _is_too_short(self, text: str) -> bool:
-        return len(text.split()) < self._sentence_min_words
-
-    def _is_too_long(self, text: str) -> bool:
-        if len(text) > self._sentence_max_chars:
-            return True
-        return len(text.split()) > self._sentence_max_words
-
-    def _split_into_sentences(self, text: str) -> List[str]:
-        sentences: List[str] = []
-        start = 0
-        for match in re.finditer(r"[.!?]+(?:['\")\]]+)?\s+", text):
-            end = match.end()
-            segment = text[start:end].strip()
-            if segment:
-                sentences.append(segment)
-            start = end
-        tail = text[start:].strip()
-        if tail:
-            sentences.append(tail)
-        return sentences
-
-    def _merge_short_segments(self, segments: List[str]) -> List[str]:
-        merged: List[str] = []
-        buffer = ""
+    def _split_into_sentences(self, words: Iterable[str]) -> Iterator[List[str]]:
+        sentence: List[str] = []
+        for word in words:
+            sentence.append(word)
+            if _SENTENCE_END_PATTERN.search(word):
+                yield sentence
+                sentence = []
+        if sentence:
+            yield sentence
+
+    def _merge_short_segments(
+        self, segments: Iterable[List[str]]
+    ) -> Iterator[List[str]]:
+        buffer: List[str] = []
         for segment in segments:
             if not buffer:
                 buffer = segment
-                continue
-            if self._is_too_short(buffer):
-                buffer = f"{buffer} {segment}".strip()
+            elif len(buffer) < self._sentence_min_words:
+                buffer = buffer + segment
             else:
-                merged.append(buffer)
+                yield buffer
                 buffer = segment
         if buffer:
-            merged.append(buffer)
-        return merged
-
-    def _chunk_by_words(self, text: str) -> List[str]:
-        words = text.split()
-        if not words:
-            return []
-        chunks: List[str] = []
-        current: List[str] = []
-        for word in words:
-            if not current:
-                current.append(word)
-                continue
-            candidate = " ".join(current + [word])
+            yield buffer
+
+    def _chunk_long_segments(
+        self, segments: Iterable[List[str]]
+    ) -> Iterator[List[str]]:
+        max_chars = self._sentence_max_chars
+        max_words = self._sentence_max_words
+        for words in segments:
             if (
-                len(candidate) > self._sentence_max_chars
-                or len(current) + 1 > self._sentence_max_words
+                len(words) <= max_words
+                and sum(map(len, words)) + len(words) - 1 <= max_chars
             ):
-                chunks.append(" ".join(current).strip())
-                current = [word]
+                yield words
                 continue
-            current.append(word)
-            if (
-                len(" ".join(current)) >= self._sentence_min_chars
-                and word.endswith((";", ":", "—", "-"))
-            ):
-                chunks.append(" ".join(current).strip())
-                current = []
-        if current:
-            chunks.append(" ".join(current).strip())
-        return chunks
+            current: List[str] = []
+            length = 0
+            for word in words:
+                if not current:
+                    current = [word]
+                    length = len(word)
+                    continue
+                if length + 1 + len(word) > max_chars or len(current) + 1 > max_words:
+                    yield current
+                    current = [word]
+                    length = len(word)
+                    continue
+                current.append(word)
+                length += 1 + len(word)
+                if length >= self._sentence_min_chars and word[-1] in _CLAUSE_BREAK_CHARS:
+                    yield current
+                    current = []
+            if current:
+                yield current
 
     def _split_text_for_tts(self, text: str) -> List[str]:
-        normalized = self._normalize_text(text)
-        if not normalized:
-            return []
-        segments = self._split_into_sentences(normalized)
-        if not segments:
-            return [normalized]
-        segments = self._merge_short_segments(segments)
-        expanded: List[str] = []
-        for segment in segments:
-            if self._is_too_long(segment):
-                expanded.extend(self._chunk_by_words(segment))
-            else:
-                expanded.append(segment)
-        expanded = [segment.strip() for segment in expanded if segment.strip()]
-        return self._merge_short_segments(expanded) or [normalized]
-
-    def _get_worker_script_path(self) -> str:
-        """Get the path to the standalone worker script."""
-        # Look for kokoro_worker.py in the same directory as this file
-        current_dir = Path(__file__).parent
-        if self._model_name.startswith("Marvis-AI"):
-            worker_path = current_dir / "marvis_worker.py"
-        elif self._model_name.startswith("mlx-community/Qwen3-TTS-"):
-            worker_path = current_dir / "qwen3_worker.py"
-        else:
-            worker_path = current_dir / "kokoro_worker.py"
+        """Segments of `text` for sentence streaming, in one pass over its words.
+
+        Sentences under sentence_min_words are merged with the next one; a
+        result over sentence_max_chars/sentence_max_words is cut at word
+        boundaries (early after ;, :, — or - once sentence_min_chars is
+        reached), and a final piece that is still too short joins the one
+        before it if the two fit within those limits. Each stage works on
+        word lists, so strings are only joined for the output.
+        """
+        segments = list(
+            self._chunk_long_segments(
+                self._merge_short_segments(self._split_into_sentences(text.split()))
+            )
+        )
+        # Cut pieces already respect the limits; merging them all again could
+        # push them back over, so only a short tail is folded in, and only
+        # when the result still fits.
+        if len(segments) > 1 and len(segments[-1]) < self._sentence_min_words:
+            merged = segments[-2] + segments[-1]
+            if (
+                len(merged) <= self._sentence_max_words
+                and sum(map(len, merged)) + len(merged) - 1 <= self._sentence_max_chars
+            ):
+                segments[-2:] = [merged]
+        return [" ".join(words) for words in segments]
 
-        logger.info(f"Using worker script: {worker_path}")
+    @staticmethod
+    def _is_running(process) -> bool:
+        return process is not None and process.returncode is None
 
-        if not worker_path.exists():
-            raise FileNotFoundError(
-                f"Worker script not found at {worker_path}. "
-                "Make sure worker script is in the same directory as tts_mlx_isolated.py"
-            )
+    def _get_worker_python(self) -> str:
+        """Get the interpreter that runs the worker script."""
+        python_exec = os.environ.get("TTS_WORKER_PYTHON") or sys.executable
+        if self._model_name.startswith("mlx-community/Qwen3-TTS-"):
+            qwen_python = os.environ.get("QWEN_TTS_PYTHON")
+            if qwen_python:
+                python_exec = qwen_python
+            else:
+                logger.warning(
+                    "QWEN_TTS_PYTHON not set. Using default Python for Qwen worker."
+                )
+        return python_exec
+
+    async def _spawn_worker(self, extra_env: Optional[Dict[str, str]] = None):
+        """Launch a worker process for this service's model."""
+        env = {**self._worker_env, **extra_env} if extra_env else self._worker_env
+        return await asyncio.create_subprocess_exec(
+            self._worker_python,
+            self._worker_script,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # stderr=subprocess.PIPE,
+            env=env,
+            # Room for a whole PCM frame before the reader pauses the pipe.
+            limit=1 << 20,
+        )
 
-        return str(worker_path)
+    async def _start_spare(self, state: Dict[str, Any], replacing: bool = False) -> None:
+        """Keep one pre-loaded worker in reserve when IARA_TTS_SPARE_WORKER=1.
+
+        The spare loads and warms the model on its own while the active worker
+        serves requests, so replacing a dead or reset worker skips the cold
+        start. It costs a second copy of the model in memory, hence opt-in;
+        `replacing` starts one regardless, once the active worker is gone.
+        """
+        if not replacing and os.environ.get("IARA_TTS_SPARE_WORKER") != "1":
+            return
+        if self._is_running(state.get("spare")):
+            return
+        preload = {"IARA_PRELOAD_MODEL": self._model_name}
+        if self._model_name.startswith("mlx-community/Qwen3-TTS-"):
+            preload["IARA_PRELOAD_MODE"] = self._qwen_settings.get("mode") or "base"
+        elif self._voice:
+            preload["IARA_PRELOAD_VOICE"] = self._voice
+        try:
+            state["spare"] = await self._spawn_worker(preload)
+            logger.info(f"Started spare {self._model_name} worker: {state['spare'].pid}")
+        except Exception as e:
+            state["spare"] = None
+            logger.warning(f"Failed to start spare worker: {e}")
 
-    def _start_worker(self):
+    async def _start_worker(self):
         """Start the worker process."""
         try:
             state = self._get_shared_state()
             existing = state.get("process")
-            if existing and existing.poll() is None:
+            if self._is_running(existing):
                 self._process = existing
                 logger.info(f"Reusing {self._model_name} worker process: {self._process.pid}")
                 return True
-            python_exec = os.environ.get("TTS_WORKER_PYTHON") or sys.executable
-            if self._model_name.startswith("mlx-community/Qwen3-TTS-"):
-                qwen_python = os.environ.get("QWEN_TTS_PYTHON")
-                if qwen_python:
-                    python_exec = qwen_python
-                else:
-                    logger.warning(
-                        "QWEN_TTS_PYTHON not set. Using default Python for Qwen worker."
-                    )
-            env = os.environ.copy()
-            env.setdefault("PYTHONUNBUFFERED", "1")
-            env.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
-            env.setdefault("TRANSFORMERS_VERBOSITY", "error")
-            env.setdefault("TOKENIZERS_PARALLELISM", "false")
-            self._process = subprocess.Popen(
-                [python_exec, self._worker_script],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                # stderr=subprocess.PIPE,
-                text=True,
-                bufsize=0,
-                env=env,
-            )
+            spare = state.pop("spare", None)
+            if self._is_running(spare):
+                self._process = spare
+                logger.info(f"Promoted spare {self._model_name} worker: {self._process.pid}")
+            else:
+                self._process = await self._spawn_worker()
+                logger.info(f"Started {self._model_name} worker process: {self._process.pid}")
             state["process"] = self._process
             state["initialized"] = False
-            logger.info(f"Started {self._model_name} worker process: {self._process.pid}")
+            await self._start_spare(state)
             return True
         except Exception as e:
             logger.error(f"Failed to start worker: {e}")
             return False
 
-    def _reset_worker_state(self, state: Dict[str, Any], reason: str) -> None:
+    async def _reset_worker_state(self, state: Dict[str, Any], reason: str) -> None:
         """Terminate the worker process and clear shared state."""
         try:
-            if self._process and self._process.poll() is None:
+            if self._is_running(self._process):
                 logger.warning(f"Resetting worker due to: {reason}")
                 self._process.terminate()
                 try:
-                    self._process.wait(timeout=5)
-                except Exception:
+                    await asyncio.wait_for(self._process.wait(), timeout=5)
+                except asyncio.TimeoutError:
                     self._process.kill()
         except Exception as exc:
             logger.error(f"Failed to terminate worker cleanly: {exc}")
@@ -277,100 +350,121 @@ class TTSMLXIsolated(TTSService):
             state["process"] = None
             state["initialized"] = False
             self._initialized = False
-
-    def _send_command(self, command: dict) -> dict:
-        """Send command to worker and get response."""
+        # Start loading the replacement now rather than on the next request.
+        await self._start_spare(state, replacing=True)
+
+    @classmethod
+    async def stop_all_workers(cls) -> None:
+        """Terminate every shared worker, active and spare; used at shutdown."""
+        processes = []
+        for state in cls._shared_state.values():
+            for key in ("process", "spare"):
+                process = state.get(key)
+                state[key] = None
+                if cls._is_running(process):
+                    process.terminate()
+                    processes.append(process)
+            state["initialized"] = False
+        if not processes:
+            return
+        waiters = [asyncio.ensure_future(process.wait()) for process in processes]
+        _, pending = await asyncio.wait(waiters, timeout=5)
+        for waiter in pending:
+            waiter.cancel()
+        for process in processes:
+            if process.returncode is None:
+                process.kill()
+
+    async def _read_frame(self, deadline: float) -> Optional[Tuple[int, bytes]]:
+        """Next (frame type, payload) from the worker; None on EOF or timeout."""
+        stdout = self._process.stdout
+        try:
+            header = await asyncio.wait_for(
+                stdout.readexactly(HEADER.size), deadline - time.monotonic()
+            )
+            frame_type, length = HEADER.unpack(header)
+            payload = await asyncio.wait_for(
+                stdout.readexactly(length), deadline - time.monotonic()
+            )
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+            return None
+        return frame_type, payload
+
+    async def _read_failed(self, state: Dict[str, Any], deadline: float) -> dict:
+        """Reset a worker whose frame stream timed out or ended mid-command."""
+        if time.monotonic() >= deadline:
+            await self._reset_worker_state(state, "response timeout")
+            return {"error": "Worker response timeout"}
+        await self._reset_worker_state(state, "worker process died")
+        return {"error": "Worker process died"}
+
+    async def _send_command(
+        self,
+        command: dict,
+        on_chunk: Optional[Callable[[bytes], None]] = None,
+        on_sent: Optional[Callable[[], None]] = None,
+    ) -> dict:
+        """Send command to worker and get response.
+
+        PCM frames streamed by "generate" are handed to `on_chunk` as they
+        arrive; the returned dict is the worker's final JSON frame. Callers
+        run this as its own task (or shielded) so a cancelled caller never
+        leaves a half-read response in the pipe. Until `on_sent` is called
+        the command hasn't reached the worker and the task may be cancelled.
+        """
         try:
             state = self._get_shared_state()
-            with state["lock"]:
-                if not self._process or self._process.poll() is not None:
+            async with state["lock"]:
+                if not self._is_running(self._process):
                     logger.debug("Starting worker process...")
-                    if not self._start_worker():
+                    if not await asyncio.shield(self._start_worker()):
                         return {"error": "Failed to start worker"}
 
                 # Send command
-                cmd_json = json.dumps(command) + "\n"
                 logger.debug(f"Sending command: {command}")
-                self._process.stdin.write(cmd_json)
-                self._process.stdin.flush()
-
-                # Read response with timeout, skipping non-JSON worker output.
-                import select
+                self._process.stdin.write(dumps(command) + b"\n")
+                if on_sent is not None:
+                    on_sent()
+                await self._process.stdin.drain()
 
                 timeout = 10.0
                 if command.get("cmd") == "init":
                     timeout = 240.0
                     if str(command.get("model", "")).startswith("mlx-community/Qwen3-TTS-"):
                         timeout = 600.0
-                elif (
+                elif command.get("cmd") == "warmup" or (
                     command.get("cmd") == "generate"
                     and command.get("mode") is not None
                     and command.get("language") is not None
                 ):
-                    # Qwen generate can take longer on first run (model warmup / caching).
+                    # Qwen generate can take longer on first run (model warmup /
+                    # caching), and a warmup sends nothing until it is done.
                     timeout = 240.0
 
-                deadline = time.monotonic() + timeout
                 while True:
-                    remaining = deadline - time.monotonic()
-                    if remaining <= 0:
-                        self._reset_worker_state(state, "response timeout")
-                        return {"error": "Worker response timeout"}
-
-                    ready, _, _ = select.select([self._process.stdout], [], [], min(0.5, remaining))
-                    if not ready:
+                    # The timeout bounds the gap between frames, not the
+                    # whole utterance.
+                    deadline = time.monotonic() + timeout
+                    frame = await self._read_frame(deadline)
+                    if frame is None:
+                        return await self._read_failed(state, deadline)
+                    frame_type, payload = frame
+
+                    if frame_type == FRAME_PCM:
+                        if on_chunk is not None:
+                            on_chunk(payload)
                         continue
 
-                    response_line = self._process.stdout.readline()
-                    if not response_line:
-                        # Check if process died
-                        if self._process.poll() is not None:
-                            stderr_output = (
-                                self._process.stderr.read() if self._process.stderr else ""
-                            )
-                            self._reset_worker_state(state, "worker process died")
-                            return {"error": f"Worker process died. stderr: {stderr_output}"}
-                        return {"error": "No response from worker"}
-
-                    response_text = response_line.strip()
-                    if not response_text:
-                        continue
-
-                    try:
-                        response_data = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        logger.debug(f"Ignoring non-JSON worker output: {response_text}")
-                        continue
-
-                    if (
-                        command.get("cmd") == "generate"
-                        and response_data.get("success")
-                        and "audio" not in response_data
-                    ):
-                        logger.warning(
-                            "Worker returned success without audio; waiting for audio response."
-                        )
-                        continue
-
-                    # Don't log the full response if it contains audio data (too verbose)
-                    if "audio" in response_data:
-                        logger.debug(
-                            f"Worker response: success with {len(response_data.get('audio', ''))} chars of audio data"
-                        )
-                    else:
-                        logger.debug(f"Worker response: {response_text}")
+                    response_data = loads(payload)
+                    worker_traceback = response_data.pop("traceback", None)
+                    if worker_traceback:
+                        logger.error(f"Worker traceback:\n{worker_traceback}")
+                    logger.debug(f"Worker response: {response_data}")
                     return response_data
 
         except Exception as e:
             logger.error(f"Worker communication error: {e}")
-            self._reset_worker_state(self._get_shared_state(), "communication error")
-            # Get stderr if available
-            if self._process and self._process.stderr:
-                try:
-                    stderr_output = self._process.stderr.read()
-                    logger.error(f"Worker stderr: {stderr_output}")
-                except:
-                    pass
+            await self._reset_worker_state(self._get_shared_state(), "communication error")
             return {"error": str(e)}
 
     async def _initialize_if_needed(self):
@@ -408,12 +502,7 @@ class TTSMLXIsolated(TTSService):
             if qwen_mode in ("base", "customVoice"):
                 init_payload["speaker"] = self._qwen_settings.get("speaker")
 
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            self._send_command,
-            init_payload,
-        )
+        result = await asyncio.shield(self._send_command(init_payload))
 
         if result.get("success"):
             self._initialized = True
@@ -423,18 +512,15 @@ class TTSMLXIsolated(TTSService):
         else:
             error_msg = result.get("error", "Unknown error")
             logger.error(f"Worker initialization failed: {error_msg}")
-
-            # Also check if process died
-            if self._process and self._process.poll() is not None:
-                stderr_output = self._process.stderr.read() if self._process.stderr else ""
-                logger.error(f"Worker process stderr: {stderr_output}")
-
             return False
 
     async def _handle_interruption(self, frame, direction):
         await super()._handle_interruption(frame, direction)
         # Increment interrupt id so any in-flight generation is dropped.
         self._interrupt_id += 1
+        # Stop the worker now instead of when run_tts next checks the id.
+        for stop in list(self._streams.values()):
+            stop()
 
     async def warmup(self) -> bool:
         """Preload the TTS worker and model."""
@@ -443,27 +529,38 @@ class TTSMLXIsolated(TTSService):
     def can_generate_metrics(self) -> bool:
         return True
 
-    def _attach_sequence_metadata(
-        self, frame: Frame, index: int, total: int, text: str
-    ) -> None:
-        metadata = {
+    @staticmethod
+    def _sequence_metadata(index: int, total: int, text: str) -> Dict[str, Any]:
+        return {
             "tts_segment_index": index,
             "tts_segment_count": total,
             "tts_segment_text": text,
         }
-        try:
-            if hasattr(frame, "set_metadata"):
-                frame.set_metadata(metadata)
-                return
-            existing = getattr(frame, "metadata", None)
-            if isinstance(existing, dict):
-                existing.update(metadata)
+
+    @staticmethod
+    def _merge_frame_metadata(frame: Frame, metadata: Dict[str, Any]) -> None:
+        existing = getattr(frame, "metadata", None)
+        if isinstance(existing, dict):
+            existing.update(metadata)
+        else:
+            setattr(frame, "metadata", dict(metadata))
+
+    def _attach_sequence_metadata(self, frame: Frame, metadata: Dict[str, Any]) -> None:
+        """Attach a segment's `metadata`, shared by its frames, to one frame."""
+        writer = self._metadata_writers.get(type(frame))
+        if writer is None:
+            set_metadata = getattr(type(frame), "set_metadata", None)
+            if set_metadata is not None:
+                writer = lambda f, m: set_metadata(f, dict(m))
             else:
-                setattr(frame, "metadata", metadata)
+                writer = self._merge_frame_metadata
+            self._metadata_writers[type(frame)] = writer
+        try:
+            writer(frame, metadata)
         except Exception:
             pass
 
-    async def _generate_audio_bytes(self, text: str) -> bytes:
+    def _build_generate_payload(self, text: str) -> dict:
         payload = {"cmd": "generate", "text": text}
         if self._model_name.startswith("mlx-community/Qwen3-TTS-"):
             qwen_mode = self._qwen_settings.get("mode")
@@ -489,20 +586,143 @@ class TTSMLXIsolated(TTSService):
                 payload["instruct"] = self._qwen_settings.get("instruct")
             if qwen_mode in ("base", "customVoice"):
                 payload["speaker"] = self._qwen_settings.get("speaker")
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, self._send_command, payload
+        return payload
+
+    async def _stream_audio(self, text: str) -> AsyncGenerator[bytes, None]:
+        """Yield PCM for `text` segment by segment as the worker produces it."""
+        chunks: asyncio.Queue = asyncio.Queue()
+        sent = stopped = False
+
+        def on_sent() -> None:
+            nonlocal sent
+            sent = True
+
+        def stop() -> None:
+            nonlocal stopped
+            if stopped or future.done():
+                return
+            stopped = True
+            if sent:
+                self._cancel_generate()
+            else:
+                # Still queued behind another command; drop it unsent.
+                future.cancel()
+
+        # The command task keeps draining the response even if the caller
+        # stops early (interruption), so the pipe stays in sync; the worker is
+        # asked to cancel so that drain is short.
+        future = asyncio.ensure_future(
+            self._send_command(
+                self._build_generate_payload(text), chunks.put_nowait, on_sent
+            )
         )
+        self._streams[future] = stop
+        future.add_done_callback(lambda done: self._streams.pop(done, None))
+        future.add_done_callback(lambda _: chunks.put_nowait(None))
+        try:
+            while True:
+                data = await chunks.get()
+                if data is None:
+                    break
+                yield data
+        finally:
+            stop()
+
+        if future.cancelled():
+            raise _GenerateCancelled(text)
+        result = future.result()
+        if result.get("cancelled"):
+            raise _GenerateCancelled(text)
         if not result.get("success"):
             raise RuntimeError(f"Audio generation failed: {result.get('error')}")
-        audio_b64 = result["audio"]
-        return base64.b64decode(audio_b64)
+
+    async def _cached_audio(self, text: str) -> AsyncGenerator[bytes, None]:
+        """_stream_audio, answered from the audio cache when `text` repeats.
+
+        A segment already being generated for another caller is awaited and
+        replayed rather than generated twice.
+        """
+        cls = self.__class__
+        key = (
+            self._signature,
+            json.dumps(self._build_generate_payload(text), sort_keys=True),
+        )
+        cached = cls._audio_cache.get(key)
+        if cached is not None:
+            cls._audio_cache.move_to_end(key)
+            for data in cached:
+                yield data
+            return
+        waiting = cls._audio_inflight.get(key)
+        if waiting is not None:
+            # None when that generate didn't finish; then run our own.
+            shared = await asyncio.shield(waiting)
+            if shared is not None:
+                for data in shared:
+                    yield data
+                return
+
+        inflight = asyncio.get_running_loop().create_future()
+        cls._audio_inflight[key] = inflight
+        chunks = []
+        finished = False
+        try:
+            async for data in self._stream_audio(text):
+                chunks.append(data)
+                yield data
+            finished = True
+        finally:
+            if cls._audio_inflight.get(key) is inflight:
+                del cls._audio_inflight[key]
+            inflight.set_result(tuple(chunks) if finished else None)
+
+        # Interrupted or failed generates are never cached.
+        size = sum(len(data) for data in chunks)
+        if not chunks or size > self._audio_cache_max_bytes or key in cls._audio_cache:
+            return
+        cls._audio_cache[key] = tuple(chunks)
+        cls._audio_cache_bytes += size
+        while cls._audio_cache_bytes > self._audio_cache_max_bytes:
+            _, evicted = cls._audio_cache.popitem(last=False)
+            cls._audio_cache_bytes -= sum(len(data) for data in evicted)
+
+    def _prefetch_audio(self, text: str) -> Tuple[asyncio.Task, asyncio.Queue]:
+        """Start producing `text`'s audio now; the queue ends with None or an exception."""
+        chunks: asyncio.Queue = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async for data in self._cached_audio(text):
+                    chunks.put_nowait(data)
+            except Exception as e:
+                chunks.put_nowait(e)
+            else:
+                chunks.put_nowait(None)
+
+        return asyncio.ensure_future(produce()), chunks
+
+    def _cancel_generate(self) -> None:
+        """Ask the worker to stop the generate it is streaming."""
+        process = self._process
+        if not self._is_running(process):
+            return
+        try:
+            # Commands are written from the event loop too, so this line
+            # can't land in the middle of one.
+            process.stdin.write(dumps({"cmd": "cancel"}) + b"\n")
+        except Exception as exc:
+            logger.debug(f"Could not send cancel to worker: {exc}")
 
     async def warmup_generate(self, text: str = "Hello") -> bool:
         """Warm up model by generating a short audio sample."""
         if not await self._initialize_if_needed():
             return False
-        await self._generate_audio_bytes(text)
+        payload = self._build_generate_payload(text)
+        # The worker synthesizes and discards the audio; only the result comes back.
+        payload["cmd"] = "warmup"
+        result = await asyncio.shield(self._send_command(payload))
+        if not result.get("success"):
+            raise RuntimeError(f"Audio generation failed: {result.get('error')}")
         return True
 
     @traced_tts
@@ -510,6 +730,8 @@ class TTSMLXIsolated(TTSService):
         """Generate speech using isolated worker process."""
         logger.debug(f"{self}: Generating TTS [{text}]")
         start_interrupt_id = self._interrupt_id
+        # (task, queue) of the segment playing now and the one queued after it.
+        current = upcoming = None
 
         try:
             await self.start_ttfb_metrics()
@@ -540,26 +762,36 @@ class TTSMLXIsolated(TTSService):
                     continue
                 if self._interrupt_id != start_interrupt_id:
                     return
-                audio_bytes = await self._generate_audio_bytes(segment)
-                if self._interrupt_id != start_interrupt_id:
-                    return
-                if not ttfb_stopped:
-                    await self.stop_ttfb_metrics()
-                    ttfb_stopped = True
-
-                if CHUNK_SIZE <= 0:
-                    CHUNK_SIZE = len(audio_bytes) if len(audio_bytes) > 0 else 1
-                for i in range(0, len(audio_bytes), CHUNK_SIZE):
+                current = upcoming or self._prefetch_audio(segment)
+                upcoming = None
+                next_segment = segments[index + 1] if index + 1 < total_segments else None
+                metadata = self._sequence_metadata(index, total_segments, segment)
+                while True:
+                    audio_bytes = await current[1].get()
                     if self._interrupt_id != start_interrupt_id:
                         return
-                    chunk = audio_bytes[i : i + CHUNK_SIZE]
-                    if len(chunk) > 0:
-                        frame = TTSAudioRawFrame(chunk, self.sample_rate, 1)
-                        self._attach_sequence_metadata(
-                            frame, index=index, total=total_segments, text=segment
-                        )
-                        yield frame
-                        await asyncio.sleep(0.001)
+                    if audio_bytes is None:
+                        break
+                    if isinstance(audio_bytes, Exception):
+                        raise audio_bytes
+                    if next_segment and upcoming is None:
+                        # Queue the next segment behind this one so the worker
+                        # moves straight on to it while this one plays out.
+                        upcoming = self._prefetch_audio(next_segment)
+                    if not ttfb_stopped:
+                        await self.stop_ttfb_metrics()
+                        ttfb_stopped = True
+
+                    step = CHUNK_SIZE if CHUNK_SIZE > 0 else max(len(audio_bytes), 1)
+                    for i in range(0, len(audio_bytes), step):
+                        if self._interrupt_id != start_interrupt_id:
+                            return
+                        chunk = audio_bytes[i : i + step]
+                        if len(chunk) > 0:
+                            frame = TTSAudioRawFrame(chunk, self.sample_rate, 1)
+                            self._attach_sequence_metadata(frame, metadata)
+                            yield frame
+                            await asyncio.sleep(0)
 
         except asyncio.CancelledError:
             raise
@@ -567,6 +799,9 @@ class TTSMLXIsolated(TTSService):
             logger.error(f"Error in run_tts: {e}")
             yield ErrorFrame(error=str(e))
         finally:
+            for pending in (current, upcoming):
+                if pending is not None and not pending[0].done():
+                    pending[0].cancel()
             logger.debug(f"{self}: Finished TTS [{text}]")
             await self.stop_ttfb_metrics()
             yield TTSStoppedFrame()